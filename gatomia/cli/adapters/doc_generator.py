@@ -6,20 +6,62 @@ and provides CLI-specific functionality like progress reporting.
 """
 
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 import asyncio
+import functools
+import hashlib
+import json
 import os
 import logging
 import sys
 
 
+from gatomia import __version__
 from gatomia.cli.utils.progress import ProgressTracker
 from gatomia.cli.models.job import DocumentationJob, LLMConfig
 from gatomia.cli.utils.errors import APIError
 
 # Import backend modules
 from gatomia.src.be.documentation_generator import DocumentationGenerator
-from gatomia.src.config import Config as BackendConfig, set_cli_context
+from gatomia.src.be.cluster_modules import cluster_modules
+from gatomia.src.be.llm_services import run_and_close_llm_clients
+from gatomia.src.be.dependency_analyzer.models.core import Node
+from gatomia.src.be.dependency_analyzer.utils.logging_config import ColoredFormatter
+from gatomia.src.be.dependency_analyzer.utils.patterns import DEFAULT_IGNORE_PATTERNS
+from gatomia.src.utils import file_manager
+from gatomia.src.config import (
+    Config as BackendConfig,
+    set_cli_context,
+    FIRST_MODULE_TREE_FILENAME,
+    MODULE_TREE_FILENAME,
+)
+
+# Parsed (components, leaf_nodes) reused across CLI invocations when sources are unchanged.
+# Kept outside the docs tree, which is committed and published, one JSON file per repository.
+DEPENDENCY_GRAPH_CACHE_DIR = Path.home() / ".cache" / "gatomia" / "depgraph"
+
+# Directories the source fingerprint doesn't descend into: installed dependencies, plus the
+# plain directory names the analyzer ignores anyway
+_FINGERPRINT_SKIP_DIRS = frozenset(
+    {"node_modules", "bower_components", "vendor", "venv", "site-packages"}
+    | {p for p in DEFAULT_IGNORE_PATTERNS if not any(c in p for c in "*?[")}
+)
+
+logger = logging.getLogger(__name__)
+
+
+@functools.cache
+def _get_backend_handler(verbose: bool) -> logging.Handler:
+    """Return the shared colored console handler for backend logs."""
+    if verbose:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setLevel(logging.INFO)
+    else:
+        # Warnings and errors go to stderr
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setLevel(logging.WARNING)
+    handler.setFormatter(ColoredFormatter())
+    return handler
 
 
 class CLIDocumentationGenerator:
@@ -71,41 +113,16 @@ class CLIDocumentationGenerator:
 
     def _configure_backend_logging(self):
         """Configure backend logger for CLI use with colored output."""
-        from gatomia.src.be.dependency_analyzer.utils.logging_config import ColoredFormatter
-
         # Get backend logger (parent of all backend modules)
         backend_logger = logging.getLogger("gatomia.src.be")
 
-        # Remove existing handlers to avoid duplicates
-        backend_logger.handlers.clear()
-
-        if self.verbose:
-            # In verbose mode, show INFO and above
-            backend_logger.setLevel(logging.INFO)
-
-            # Create console handler with formatting
-            console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setLevel(logging.INFO)
-
-            # Use colored formatter for better readability
-            colored_formatter = ColoredFormatter()
-            console_handler.setFormatter(colored_formatter)
+        # In verbose mode show INFO and above, otherwise only warnings and errors
+        backend_logger.setLevel(logging.INFO if self.verbose else logging.WARNING)
 
-            # Add handler to logger
-            backend_logger.addHandler(console_handler)
-        else:
-            # In non-verbose mode, suppress backend logs (use WARNING level to hide INFO/DEBUG)
-            backend_logger.setLevel(logging.WARNING)
-
-            # Create console handler for warnings and errors only
-            console_handler = logging.StreamHandler(sys.stderr)
-            console_handler.setLevel(logging.WARNING)
-
-            # Use colored formatter even for warnings/errors
-            colored_formatter = ColoredFormatter()
-            console_handler.setFormatter(colored_formatter)
-
-            backend_logger.addHandler(console_handler)
+        # Reuse the shared handler; replacing it also removes duplicates
+        handler = _get_backend_handler(self.verbose)
+        if backend_logger.handlers != [handler]:
+            backend_logger.handlers[:] = [handler]
 
         # Prevent propagation to root logger to avoid duplicate messages
         backend_logger.propagate = False
@@ -130,7 +147,7 @@ class CLIDocumentationGenerator:
             backend_config = self._create_backend_config()
 
             # Run backend documentation generation
-            asyncio.run(self._run_backend_generation(backend_config))
+            asyncio.run(run_and_close_llm_clients(self._run_backend_generation(backend_config)))
 
             # Stage 4: HTML Generation (optional)
             if self.generate_html:
@@ -175,7 +192,7 @@ class CLIDocumentationGenerator:
             backend_config = self._create_backend_config()
 
             # Run only analysis stages
-            asyncio.run(self._run_analysis_only(backend_config))
+            asyncio.run(run_and_close_llm_clients(self._run_analysis_only(backend_config)))
 
             # Complete job
             self.job.complete()
@@ -211,34 +228,7 @@ class CLIDocumentationGenerator:
 
     async def _run_analysis_only(self, backend_config: BackendConfig):
         """Run only the analysis stages of the backend."""
-        # Stage 1: Dependency Analysis
-        self.progress_tracker.start_stage(1, "Dependency Analysis")
-        doc_generator = DocumentationGenerator(backend_config)
-        components, leaf_nodes = doc_generator.graph_builder.build_dependency_graph()
-        self.job.statistics.total_files_analyzed = len(components)
-        self.job.statistics.leaf_nodes = len(leaf_nodes)
-        self.progress_tracker.complete_stage()
-
-        # Stage 2: Module Clustering
-        self.progress_tracker.start_stage(2, "Module Clustering")
-        from gatomia.src.be.cluster_modules import cluster_modules
-        from gatomia.src.utils import file_manager
-        from gatomia.src.config import FIRST_MODULE_TREE_FILENAME, MODULE_TREE_FILENAME
-
-        working_dir = str(self.output_dir.absolute())
-        file_manager.ensure_directory(working_dir)
-        first_module_tree_path = os.path.join(working_dir, FIRST_MODULE_TREE_FILENAME)
-        module_tree_path = os.path.join(working_dir, MODULE_TREE_FILENAME)
-
-        if os.path.exists(first_module_tree_path):
-            module_tree = file_manager.load_json(first_module_tree_path)
-        else:
-            module_tree = await cluster_modules(leaf_nodes, components, backend_config)
-            file_manager.save_json(module_tree, first_module_tree_path)
-
-        file_manager.save_json(module_tree, module_tree_path)
-        self.job.module_count = len(module_tree)
-        self.progress_tracker.complete_stage()
+        await self._stage_analysis(backend_config)
 
         # Stage 3 is skipped in analyze mode
         self.progress_tracker.start_stage(3, "Documentation Generation (Skipped)")
@@ -248,28 +238,23 @@ class CLIDocumentationGenerator:
         self.progress_tracker.start_stage(5, "Finalization")
         self.progress_tracker.complete_stage()
 
-    async def _run_backend_generation(self, backend_config: BackendConfig):
-        """Run the backend documentation generation with progress tracking."""
+    async def _stage_analysis(self, backend_config: BackendConfig):
+        """
+        Run stages 1 (dependency analysis) and 2 (module clustering).
 
+        Returns:
+            Tuple of (doc_generator, components, leaf_nodes, working_dir)
+        """
         # Stage 1: Dependency Analysis
         self.progress_tracker.start_stage(1, "Dependency Analysis")
-        # if self.verbose:
-        #     self.progress_tracker.update_stage(0.2, "Initializing dependency analyzer...")
-
-        # Create documentation generator
         doc_generator = DocumentationGenerator(backend_config)
 
-        # if self.verbose:
-        #     self.progress_tracker.update_stage(0.5, "Parsing source files...")
-
-        # Build dependency graph
         try:
-            components, leaf_nodes = doc_generator.graph_builder.build_dependency_graph()
+            components, leaf_nodes = self._load_or_build_dependency_graph(
+                doc_generator, backend_config
+            )
             self.job.statistics.total_files_analyzed = len(components)
             self.job.statistics.leaf_nodes = len(leaf_nodes)
-
-            # if self.verbose:
-            #     self.progress_tracker.update_stage(1.0, f"Found {len(leaf_nodes)} leaf nodes")
         except Exception as e:
             raise APIError(f"Dependency analysis failed: {e}")
 
@@ -277,13 +262,6 @@ class CLIDocumentationGenerator:
 
         # Stage 2: Module Clustering
         self.progress_tracker.start_stage(2, "Module Clustering")
-        # if self.verbose:
-        #     self.progress_tracker.update_stage(0.5, "Clustering modules with LLM...")
-
-        # Import clustering function
-        from gatomia.src.be.cluster_modules import cluster_modules
-        from gatomia.src.utils import file_manager
-        from gatomia.src.config import FIRST_MODULE_TREE_FILENAME, MODULE_TREE_FILENAME
 
         working_dir = str(self.output_dir.absolute())
         file_manager.ensure_directory(working_dir)
@@ -293,28 +271,126 @@ class CLIDocumentationGenerator:
         try:
             if os.path.exists(first_module_tree_path):
                 module_tree = file_manager.load_json(first_module_tree_path)
+                file_manager.save_json(module_tree, module_tree_path)
             else:
                 module_tree = await cluster_modules(leaf_nodes, components, backend_config)
-                file_manager.save_json(module_tree, first_module_tree_path)
-
-            file_manager.save_json(module_tree, module_tree_path)
+                # Serialize once, write both copies
+                payload = file_manager.dumps_json(module_tree)
+                file_manager.save_bytes(payload, first_module_tree_path)
+                file_manager.save_bytes(payload, module_tree_path)
             self.job.module_count = len(module_tree)
-
-            # if self.verbose:
-            #     self.progress_tracker.update_stage(1.0, f"Created {len(module_tree)} modules")
         except Exception as e:
             raise APIError(f"Module clustering failed: {e}")
 
         self.progress_tracker.complete_stage()
 
+        return doc_generator, components, leaf_nodes, working_dir
+
+    def _load_or_build_dependency_graph(
+        self, doc_generator: DocumentationGenerator, backend_config: BackendConfig
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Return (components, leaf_nodes), reusing the cached graph when sources are unchanged.
+
+        The cache lets `mia analyze` followed by `mia generate` parse the repository once.
+        """
+        repo_root = os.path.abspath(str(self.repo_path))
+        cache_key = hashlib.sha256(repo_root.encode("utf-8", "surrogateescape")).hexdigest()[:16]
+        cache_path = DEPENDENCY_GRAPH_CACHE_DIR / f"{cache_key}.json"
+        fingerprint = self._source_fingerprint(backend_config)
+
+        if cache_path.exists():
+            try:
+                cached = json.loads(cache_path.read_bytes())
+                if cached.get("fingerprint") == fingerprint:
+                    components = {
+                        component_id: Node.model_validate(data)
+                        for component_id, data in cached["components"].items()
+                    }
+                    leaf_nodes = cached["leaf_nodes"]
+                    # Commands such as update read the graph JSON from the docs' temp dir
+                    doc_generator.graph_builder.save_dependency_graph(components)
+                    return components, leaf_nodes
+            except Exception as e:
+                logger.debug("Ignoring unreadable graph cache: %s", e)
+
+        components, leaf_nodes = doc_generator.graph_builder.build_dependency_graph()
+
+        try:
+            payload = {
+                "fingerprint": fingerprint,
+                "components": {
+                    component_id: component.model_dump(mode="json")
+                    for component_id, component in components.items()
+                },
+                "leaf_nodes": leaf_nodes,
+            }
+            file_manager.ensure_directory(str(DEPENDENCY_GRAPH_CACHE_DIR))
+            file_manager.save_bytes(
+                json.dumps(payload, ensure_ascii=False).encode("utf-8"), str(cache_path)
+            )
+        except Exception as e:
+            logger.debug("Could not write graph cache: %s", e)
+
+        return components, leaf_nodes
+
+    def _source_fingerprint(self, backend_config: BackendConfig) -> str:
+        """
+        Hash everything the cached dependency graph depends on.
+
+        Covers the path, size and mtime of every repository file, the include/exclude
+        patterns and the GatomIA version, so an analyzer upgrade invalidates the cache.
+        """
+        digest = hashlib.sha256()
+        digest.update(__version__.encode("utf-8"))
+        digest.update(repr(backend_config.include_patterns).encode("utf-8"))
+        digest.update(repr(backend_config.exclude_patterns).encode("utf-8"))
+
+        repo_root = os.path.abspath(str(self.repo_path))
+        output_root = os.path.abspath(str(self.output_dir))
+        entries = []
+        for dirpath, dirnames, filenames in os.walk(repo_root):
+            # Skip hidden directories (.git, .venv, ...), installed dependencies and our output
+            dirnames[:] = [
+                d
+                for d in dirnames
+                if not d.startswith(".")
+                and d not in _FINGERPRINT_SKIP_DIRS
+                and os.path.join(dirpath, d) != output_root
+            ]
+            for name in filenames:
+                full_path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(full_path)
+                except OSError:
+                    continue
+                entries.append(
+                    f"{os.path.relpath(full_path, repo_root)}\0{st.st_size}\0{st.st_mtime_ns}"
+                )
+
+        for entry in sorted(entries):
+            digest.update(entry.encode("utf-8", "surrogateescape"))
+            digest.update(b"\n")
+        return digest.hexdigest()
+
+    async def _run_backend_generation(self, backend_config: BackendConfig):
+        """Run the backend documentation generation with progress tracking."""
+        doc_generator, components, leaf_nodes, working_dir = await self._stage_analysis(
+            backend_config
+        )
+
         # Stage 3: Documentation Generation
         self.progress_tracker.start_stage(3, "Documentation Generation")
 
-        # Define progress callback for backend
+        # Define progress callback for backend. Leaf modules run concurrently, so
+        # callbacks can arrive out of order; never move the bar backwards.
+        highest_progress = 0.0
+
         def update_progress(current: int, total: int, module_name: str, cached: bool):
-            progress = current / total if total > 0 else 0
+            nonlocal highest_progress
+            highest_progress = max(highest_progress, current / total if total > 0 else 0)
             status = " (cached)" if cached else ""
-            self.progress_tracker.update_stage(progress, message=f"{module_name}{status}")
+            self.progress_tracker.update_stage(highest_progress, message=f"{module_name}{status}")
 
         try:
             # Run the actual documentation generation
@@ -333,9 +409,12 @@ class CLIDocumentationGenerator:
             doc_generator.create_documentation_metadata(working_dir, components, len(leaf_nodes))
 
             # Collect generated files
-            for file_path in os.listdir(working_dir):
-                if file_path.endswith(".md") or file_path.endswith(".json"):
-                    self.job.files_generated.append(file_path)
+            with os.scandir(working_dir) as entries:
+                self.job.files_generated.extend(
+                    entry.name
+                    for entry in entries
+                    if entry.name.endswith((".md", ".json")) and entry.is_file(follow_symlinks=False)
+                )
 
         except Exception as e:
             raise APIError(f"Documentation generation failed: {e}")
@@ -3,19 +3,36 @@ CLI adapter for documentation updates.
 """
 
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import logging
-import asyncio
 import json
+import os
+import re
 
 from gatomia.cli.utils.errors import APIError, ConfigurationError
-from gatomia.src.be.llm_services import call_llm
-from gatomia.src.be.prompt_template import format_update_doc_prompt, format_create_doc_prompt
-from gatomia.src.config import Config as BackendConfig, MODULE_TREE_FILENAME
+from gatomia.src.be.llm_services import call_llm_many, call_llm_with_retry
+from gatomia.src.be.prompt_template import (
+    format_update_doc_prefix,
+    format_update_doc_request,
+    format_create_doc_prefix,
+    format_create_doc_request,
+)
+from gatomia.src.config import (
+    Config as BackendConfig,
+    MODULE_TREE_FILENAME,
+)
 from gatomia.src.be.dependency_analyzer import DependencyGraphBuilder
 
 logger = logging.getLogger(__name__)
 
+# Instructions mentioning these imply the dependency graph is stale
+_REFRESH_KEYWORDS_RE = re.compile(r"refactor|new structure|changed dependencies", re.IGNORECASE)
+# Node fields that are never sent to the LLM but dominate dependency graph size
+_HEAVY_NODE_FIELDS = frozenset({"source_code", "docstring"})
+# Graph files above this size are parsed with heavy fields pruned during decoding
+_PRUNE_ON_PARSE_THRESHOLD = 4 * 1024 * 1024
+
 
 class CLIDocumentationUpdater:
     """
@@ -28,11 +45,14 @@ class CLIDocumentationUpdater:
         output_dir: Path,
         config: Dict[str, Any],
         verbose: bool = False,
+        include_context: bool = True,
     ):
         self.repo_path = repo_path
         self.output_dir = output_dir
         self.config = config
         self.verbose = verbose
+        # When False, prompts omit the module tree/dependency graph and nothing is loaded
+        self.include_context = include_context
 
         # Create backend config
         self.backend_config = BackendConfig.from_cli(
@@ -50,6 +70,18 @@ class CLIDocumentationUpdater:
 
         self.graph_builder = DependencyGraphBuilder(self.backend_config)
 
+        # Parsed context files keyed by path -> (st_mtime_ns, payload). Dependency graph
+        # entries hold the simplified graph only, so `source_code` never stays in memory.
+        self._context_cache: Dict[Path, Tuple[int, Any]] = {}
+        self._context_signature: Optional[Tuple[Tuple[Path, int], ...]] = None
+        self._repo_structure: Dict[str, Any] = {}
+        self._merged_simplified: Dict[str, Any] = {}
+        self._serialized_context: Optional[Tuple[str, str]] = None
+        # Rendered prompt prefixes per mode ("update"/"create"), reset with the context
+        self._prompt_prefixes: Dict[str, str] = {}
+        # Dependency re-analysis is deferred until the context is actually needed
+        self._refresh_pending = False
+
     async def update_document(
         self, file_pattern: str, instruction: str, refresh: bool = False
     ) -> str:
@@ -65,17 +97,71 @@ class CLIDocumentationUpdater:
             Path to the updated/created file
         """
         # 1. Smart Context Loading & Refactoring Support
-        if refresh or any(
-            k in instruction.lower() for k in ["refactor", "new structure", "changed dependencies"]
-        ):
-            logger.info("Triggering dependency analysis refresh...")
-            # We assume build() is synchronous or we'd need await
-            # Based on previous analysis, graph builder might be synchronous
-            self.graph_builder.build(str(self.backend_config.repo_path))
+        self._maybe_refresh(instruction, refresh)
 
-        repo_structure, dependency_graph = self._load_context()
-        repo_context = "(Context loaded from graphs)"
+        target_file, mode, full_prompt = self._prepare_update(file_pattern, instruction)
+        return await self._apply_update(target_file, mode, full_prompt)
+
+    async def update_documents_batch(
+        self, tasks: List[Tuple[str, str]], refresh: bool = False
+    ) -> List[str]:
+        """
+        Apply several (file_pattern, instruction) updates with concurrent LLM calls.
+
+        Prompts are assembled up front against a single context load, then the LLM
+        requests run concurrently, bounded by the backend config's `llm_concurrency`.
+
+        Returns:
+            Paths to the updated/created files, in task order
+        """
+        for _, instruction in tasks:
+            if self._maybe_refresh(instruction, refresh):
+                break
+
+        prepared = [self._prepare_update(pattern, instruction) for pattern, instruction in tasks]
+        for target_file, mode, _ in prepared:
+            logger.info(f"Sending {mode.upper()} request to LLM for {target_file.name}...")
+
+        responses = await call_llm_many(
+            [full_prompt for _, _, full_prompt in prepared],
+            self.backend_config,
+            model=self.backend_config.main_model,
+            temperature=0.2,  # Low temp for precision
+        )
+
+        results: List[str] = []
+        failures: List[str] = []
+        for (target_file, mode, _), response in zip(prepared, responses):
+            try:
+                if isinstance(response, BaseException):
+                    raise response
+                results.append(self._write_update(target_file, mode, response))
+            except Exception as e:
+                failures.append(f"Failed to {mode} documentation: {e}")
+        if failures:
+            raise APIError(
+                f"{len(failures)} of {len(tasks)} updates failed:\n" + "\n".join(failures)
+            )
+        return results
+
+    def _maybe_refresh(self, instruction: str, refresh: bool) -> bool:
+        """
+        Schedule dependency re-analysis if requested or implied by the instruction.
+
+        The rebuild itself runs lazily the next time the prompt context is loaded.
+        """
+        if refresh or _REFRESH_KEYWORDS_RE.search(instruction):
+            self._refresh_pending = True
+            return True
+        return False
+
+    def _prepare_update(self, file_pattern: str, instruction: str) -> Tuple[Path, str, str]:
+        """
+        Resolve the target document and build the LLM prompt.
 
+        Returns:
+            Tuple of (target_file, mode, full_prompt) where mode is "update" or "create"
+        """
         # 2. Resolve File (Touch Logic)
         target_file = None
         mode = "update"
@@ -100,50 +186,48 @@ class CLIDocumentationUpdater:
             except Exception as e:
                 raise APIError(f"Failed to read file {target_file.name}: {e}")
 
-        # 4. Prepare Prompt
+        # 4. Prepare Prompt (context is only loaded here, and not at all with include_context=False)
+        prefix = self._get_prompt_prefix(mode)
         if mode == "update":
-            system_prompt = format_update_doc_prompt(
+            request = format_update_doc_request(
                 current_content=current_content,
                 user_instruction=instruction,
-                repo_structure=json.dumps(repo_structure, indent=2),
-                dependency_graph=json.dumps(dependency_graph, indent=2),
-                repo_context=repo_context,
             )
         else:
-            system_prompt = format_create_doc_prompt(
-                user_instruction=instruction,
-                repo_structure=json.dumps(repo_structure, indent=2),
-                dependency_graph=json.dumps(dependency_graph, indent=2),
-                repo_context=repo_context,
-            )
+            request = format_create_doc_request(user_instruction=instruction)
+
+        full_prompt = f"{prefix}\n\n{request}\n\nPlease {mode} the documentation as requested."
+        return target_file, mode, full_prompt
 
+    async def _apply_update(self, target_file: Path, mode: str, full_prompt: str) -> str:
+        """Send a prepared prompt to the LLM and write the response to target_file."""
         logger.info(f"Sending {mode.upper()} request to LLM...")
 
         try:
-            # Call LLM
-            full_prompt = f"{system_prompt}\n\nPlease {mode} the documentation as requested."
-
-            response = await call_llm(
+            # Call LLM, retrying rate limits and transient provider errors
+            response = await call_llm_with_retry(
                 prompt=full_prompt,
                 config=self.backend_config,
                 model=self.backend_config.main_model,
                 temperature=0.2,  # Low temp for precision
             )
 
-            updated_content = response
+            return self._write_update(target_file, mode, response)
 
-            # Simple validation
-            if not updated_content or len(updated_content) < 10:
-                raise APIError("LLM returned empty or invalid response")
+        except Exception as e:
+            raise APIError(f"Failed to {mode} documentation: {e}")
 
-            # Write back
-            target_file.parent.mkdir(parents=True, exist_ok=True)
-            target_file.write_text(updated_content, encoding="utf-8")
+    def _write_update(self, target_file: Path, mode: str, updated_content: str) -> str:
+        """Validate an LLM response and write it to target_file."""
+        # Simple validation
+        if not updated_content or len(updated_content) < 10:
+            raise APIError("LLM returned empty or invalid response")
 
-            return str(target_file)
+        # Write back
+        target_file.parent.mkdir(parents=True, exist_ok=True)
+        target_file.write_text(updated_content, encoding="utf-8")
 
-        except Exception as e:
-            raise APIError(f"Failed to {mode} documentation: {e}")
+        return str(target_file)
 
     def _resolve_file(self, pattern: str) -> Path:
         """Find a single matching file in the output directory."""
@@ -151,64 +235,211 @@ class CLIDocumentationUpdater:
             # If output dir doesn't exist, we can't find files, so raise Error -> triggers creation flow
             raise ConfigurationError(f"Output directory {self.output_dir} does not exist.")
 
-        files = list(self.output_dir.glob("**/*.md"))
-        matches = [f for f in files if pattern.lower() in f.name.lower()]
+        lowered_pattern = pattern.lower()
+        exact_names = (pattern, f"{pattern}.md")
+        matches: List[os.DirEntry] = []
+        exact_matches: List[os.DirEntry] = []
+        for entry in self._iter_md(self.output_dir):
+            if lowered_pattern in entry.name.lower():
+                matches.append(entry)
+                if entry.name in exact_names:
+                    exact_matches.append(entry)
 
         if not matches:
             raise ConfigurationError(f"No files found matching pattern '{pattern}'")
 
         if len(matches) > 1:
-            # Try exact match
-            exact_matches = [f for f in matches if f.name == pattern or f.name == f"{pattern}.md"]
+            # An exact name disambiguates, unless docs in several directories share it
             if len(exact_matches) == 1:
-                return exact_matches[0]
+                return Path(exact_matches[0].path)
 
             match_names = ", ".join([f.name for f in matches[:5]])
             raise ConfigurationError(
                 f"Multiple files match '{pattern}': {match_names}...\nPlease be more specific."
             )
 
-        return matches[0]
+        return Path(matches[0].path)
+
+    @classmethod
+    def _iter_md(cls, root: Path):
+        """Recursively yield `os.DirEntry` objects for markdown files under root."""
+        try:
+            with os.scandir(root) as it:
+                entries = list(it)
+        except OSError:
+            return
+
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from cls._iter_md(entry.path)
+            elif entry.name.endswith(".md") and entry.is_file():
+                yield entry
+
+    def _load_context(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Load module tree and dependency graphs.
 
-    def _load_context(self):
-        """Load module tree and dependency graphs."""
-        repo_structure = {}
-        dependency_graph = {}
+        Files are only re-parsed when their mtime changes, so repeated updates in the
+        same session reuse the already simplified graph.
+        """
+        temp_dir = self.output_dir / "temp"
+        module_tree_path = temp_dir / MODULE_TREE_FILENAME
+        dep_graph_dir = temp_dir / "dependency_graphs"
+        graph_files = sorted(dep_graph_dir.glob("*.json")) if dep_graph_dir.exists() else []
+
+        signature = tuple((path, self._mtime_ns(path)) for path in [module_tree_path, *graph_files])
+        if signature == self._context_signature:
+            return self._repo_structure, self._merged_simplified
+
+        # Forget files that no longer exist
+        live_paths = {path for path, _ in signature}
+        for path in list(self._context_cache):
+            if path not in live_paths:
+                del self._context_cache[path]
+
+        # Parse stale dependency graphs concurrently; merging stays on this thread
+        stale = [
+            (f, mtime_ns)
+            for f, mtime_ns in signature[1:]
+            if mtime_ns >= 0 and self._context_cache.get(f, (None,))[0] != mtime_ns
+        ]
+        if len(stale) > 1:
+            max_workers = min(len(stale), 32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                parsed = list(executor.map(lambda item: self._parse_json_file(item[0], True), stale))
+        else:
+            parsed = [self._parse_json_file(f, True) for f, _ in stale]
+        for (f, mtime_ns), graph in zip(stale, parsed):
+            if graph is not None:
+                self._context_cache[f] = (mtime_ns, graph)
 
         # Load Module Tree
-        module_tree_path = self.output_dir / "temp" / MODULE_TREE_FILENAME
-        if module_tree_path.exists():
-            try:
-                repo_structure = json.loads(module_tree_path.read_text())
-            except Exception as e:
-                logger.warning(f"Failed to load module tree: {e}")
-
-        # Load Dependency Graphs (merge all)
-        dep_graph_dir = self.output_dir / "temp" / "dependency_graphs"
-        if dep_graph_dir.exists():
-            for f in dep_graph_dir.glob("*.json"):
-                try:
-                    graph = json.loads(f.read_text())
-                    # deeply merge or just update top level?
-                    # For simplicity, we assume disjoint graphs or we just update
-                    dependency_graph.update(graph)
-                except Exception as e:
-                    logger.warning(f"Failed to load dependency graph {f.name}: {e}")
-
-        return repo_structure, self._simplify_graph(dependency_graph)
-
-    def _simplify_graph(self, graph: Dict[str, Any]) -> Dict[str, Any]:
+        repo_structure = self._load_cached_json(module_tree_path, signature[0][1]) or {}
+
+        # Load Dependency Graphs (merge all, assuming disjoint graphs)
+        graphs = []
+        for f, mtime_ns in signature[1:]:
+            cached = self._context_cache.get(f)
+            if cached and cached[0] == mtime_ns and cached[1]:
+                graphs.append(cached[1])
+
+        if len(graphs) == 1:
+            # Common case: a single graph file. It is only read, so share the cached dict.
+            dependency_graph = graphs[0]
+        else:
+            dependency_graph = {}
+            for graph in graphs:
+                if logger.isEnabledFor(logging.DEBUG):
+                    overlap = dependency_graph.keys() & graph.keys()
+                    if overlap:
+                        logger.debug(f"{len(overlap)} components appear in several graphs")
+                dependency_graph.update(graph)
+
+        self._context_signature = signature
+        self._repo_structure = repo_structure
+        self._merged_simplified = dependency_graph
+        self._serialized_context = None
+        self._prompt_prefixes = {}
+        return repo_structure, dependency_graph
+
+    def _get_prompt_prefix(self, mode: str) -> str:
+        """Return the rendered instruction-independent prompt prefix for mode, memoized per context."""
+        if self.include_context:
+            repo_structure_json, dependency_graph_json = self._get_serialized_context()
+            repo_context = "(Context loaded from graphs)"
+        else:
+            if self._refresh_pending:
+                logger.warning(
+                    "Dependency analysis refresh skipped: context is disabled (--no-context)"
+                )
+                self._refresh_pending = False
+            repo_structure_json, dependency_graph_json = "", ""
+            repo_context = "(Context omitted)"
+
+        prefix = self._prompt_prefixes.get(mode)
+        if prefix is None:
+            format_prefix = format_update_doc_prefix if mode == "update" else format_create_doc_prefix
+            prefix = format_prefix(
+                repo_structure=repo_structure_json,
+                dependency_graph=dependency_graph_json,
+                repo_context=repo_context,
+            )
+            self._prompt_prefixes[mode] = prefix
+        return prefix
+
+    def _get_serialized_context(self) -> Tuple[str, str]:
+        """Return the JSON-serialized module tree and dependency graph, memoized per context."""
+        if self._refresh_pending:
+            logger.info("Triggering dependency analysis refresh...")
+            self.graph_builder.build_dependency_graph()
+            self._refresh_pending = False
+
+        repo_structure, dependency_graph = self._load_context()
+        if self._serialized_context is None:
+            # Compact separators: indentation only costs prompt tokens
+            self._serialized_context = (
+                json.dumps(repo_structure, separators=(",", ":"), ensure_ascii=False),
+                json.dumps(dependency_graph, separators=(",", ":"), ensure_ascii=False),
+            )
+        return self._serialized_context
+
+    @staticmethod
+    def _mtime_ns(path: Path) -> int:
+        """Return the file mtime in nanoseconds, or -1 if it does not exist."""
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return -1
+
+    def _load_cached_json(self, path: Path, mtime_ns: int, simplify: bool = False) -> Any:
+        """Load a JSON context file, reusing the cached payload if its mtime is unchanged."""
+        if mtime_ns < 0:
+            return None
+
+        cached = self._context_cache.get(path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+
+        payload = self._parse_json_file(path, simplify)
+        if payload is not None:
+            self._context_cache[path] = (mtime_ns, payload)
+        return payload
+
+    def _parse_json_file(self, path: Path, simplify: bool = False) -> Any:
+        """Read and parse a JSON context file. Safe to call from worker threads."""
+        try:
+            data = path.read_bytes()
+            if simplify and len(data) > _PRUNE_ON_PARSE_THRESHOLD:
+                # Drop heavy fields as each object is decoded so the source code of
+                # every component is never alive at the same time.
+                payload = json.loads(data, object_pairs_hook=_drop_heavy_fields)
+            else:
+                payload = json.loads(data)
+            if simplify:
+                payload = self._simplify_graph(payload)
+        except Exception as e:
+            logger.warning(f"Failed to load {path.name}: {e}")
+            return None
+        return payload
+
+    @staticmethod
+    def _simplify_graph(graph: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a lightweight version of the graph for the LLM context.
         Removes heavy fields like 'source_code'.
         """
-        simplified = {}
-        for key, node in graph.items():
-            simplified[key] = {
+        return {
+            key: {
                 "id": node.get("id"),
                 "name": node.get("name"),
                 "type": node.get("component_type"),
                 "depends_on": node.get("depends_on", []),
                 # "docstring": node.get("docstring", "")[:200], # Optional: include truncated docstring
             }
-        return simplified
+            for key, node in graph.items()
+        }
+
+
+def _drop_heavy_fields(pairs: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    """JSON object hook that skips heavy node fields while decoding."""
+    return {key: value for key, value in pairs if key not in _HEAVY_NODE_FIELDS}
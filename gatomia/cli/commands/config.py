@@ -7,28 +7,53 @@ import sys
 import click
 from typing import Optional, List
 
-from gatomia.cli.config_manager import ConfigManager
-from gatomia.cli.models.config import AgentInstructions
+# ConfigManager (keyring) and the validation helpers are imported inside each
+# command so `gatomia config --help` does not pay for them.
 from gatomia.cli.utils.errors import (
     ConfigurationError,
     handle_error,
     EXIT_SUCCESS,
     EXIT_CONFIG_ERROR,
 )
-from gatomia.cli.utils.validation import (
-    validate_url,
-    validate_api_key,
-    validate_model_name,
-    is_top_tier_model,
-    mask_api_key,
-)
 
 
 def parse_patterns(patterns_str: str) -> List[str]:
     """Parse comma-separated patterns into a list."""
     if not patterns_str:
         return []
-    return [p.strip() for p in patterns_str.split(",") if p.strip()]
+    return [p for p in map(str.strip, patterns_str.split(",")) if p]
+
+
+def _render_agent_lines(agent, instructions_limit: Optional[int] = None) -> List[str]:
+    """
+    Render the configured agent instructions as display lines.
+
+    Args:
+        agent: AgentInstructions to render
+        instructions_limit: Truncate custom instructions to this many characters
+
+    Returns:
+        One line per configured field
+    """
+    lines = []
+    for attr, label in (
+        ("include_patterns", "Include patterns:   "),
+        ("exclude_patterns", "Exclude patterns:   "),
+        ("focus_modules", "Focus modules:      "),
+        ("doc_type", "Doc type:           "),
+    ):
+        value = getattr(agent, attr)
+        if value:
+            lines.append(f"  {label}{', '.join(value) if isinstance(value, list) else value}")
+
+    if agent.custom_instructions:
+        if instructions_limit is None:
+            lines.append(f"  Custom instructions: {agent.custom_instructions}")
+        else:
+            lines.append(
+                f"  Custom instructions: {agent.custom_instructions[:instructions_limit]}..."
+            )
+    return lines
 
 
 @click.group(name="config")
@@ -117,23 +142,29 @@ def config_set(
     # Set max depth for hierarchical decomposition
     $ gatomia config set --max-depth 3
     """
+    from gatomia.cli.config_manager import ConfigManager
+    from gatomia.cli.utils.validation import (
+        validate_url,
+        validate_api_key,
+        validate_model_name,
+        is_top_tier_model,
+    )
+
     try:
         # Check if at least one option is provided
-        if not any(
-            [
-                api_key,
-                base_url,
-                main_model,
-                cluster_model,
-                fallback_model,
-                llm_provider,
-                copilot_token,
-                max_tokens,
-                max_token_per_module,
-                max_token_per_leaf_module,
-                max_depth,
-                include_reasoning is not None,
-            ]
+        if not (
+            api_key
+            or base_url
+            or main_model
+            or cluster_model
+            or fallback_model
+            or llm_provider
+            or copilot_token
+            or max_tokens
+            or max_token_per_module
+            or max_token_per_leaf_module
+            or max_depth
+            or include_reasoning is not None
         ):
             click.echo("No options provided. Use --help for usage information.")
             sys.exit(EXIT_CONFIG_ERROR)
@@ -151,11 +182,11 @@ def config_set(
             validated_data["api_key"] = validate_api_key(api_key)
 
         # Only validate URL if provider is OpenAI (default) or explicitly set to OpenAI
-        current_provider = llm_provider.lower() if llm_provider else "openai"
-        if base_url and current_provider == "openai":
-            validated_data["base_url"] = validate_url(base_url)
-        elif base_url:
-            validated_data["base_url"] = base_url
+        if base_url:
+            current_provider = validated_data.get("llm_provider", "openai")
+            validated_data["base_url"] = (
+                validate_url(base_url) if current_provider == "openai" else base_url
+            )
 
         if main_model:
             validated_data["main_model"] = validate_model_name(main_model)
@@ -190,23 +221,10 @@ def config_set(
             validated_data["include_reasoning"] = include_reasoning
 
         # Create config manager and save
-        manager = ConfigManager()
-        manager.load()  # Load existing config if present
-
-        manager.save(
-            api_key=validated_data.get("api_key"),
-            base_url=validated_data.get("base_url"),
-            main_model=validated_data.get("main_model"),
-            cluster_model=validated_data.get("cluster_model"),
-            fallback_model=validated_data.get("fallback_model"),
-            llm_provider=validated_data.get("llm_provider"),
-            copilot_token=validated_data.get("copilot_token"),
-            max_tokens=validated_data.get("max_tokens"),
-            max_token_per_module=validated_data.get("max_token_per_module"),
-            max_token_per_leaf_module=validated_data.get("max_token_per_leaf_module"),
-            max_depth=validated_data.get("max_depth"),
-            include_reasoning=validated_data.get("include_reasoning"),
-        )
+        manager = ConfigManager.get_shared()  # Existing config, if present
+
+        # Only the supplied options are written; everything else stays as-is
+        manager.save(**validated_data)
 
         # Display success messages
         click.echo()
@@ -283,10 +301,13 @@ def config_show(output_json: bool):
     # Display as JSON
     $ gatomia config show --json
     """
+    from gatomia.cli.config_manager import ConfigManager
+    from gatomia.cli.utils.validation import mask_api_key
+
     try:
-        manager = ConfigManager()
+        manager = ConfigManager.get_shared()
 
-        if not manager.load():
+        if manager.get_config() is None:
             click.secho("\n✗ Configuration not found.", fg="red", err=True)
             click.echo("\nPlease run 'gatomia config set' to configure your API credentials:")
             click.echo("  gatomia config set --api-key <key> --base-url <url> \\")
@@ -323,71 +344,68 @@ def config_show(output_json: bool):
             }
             click.echo(json.dumps(output, indent=2))
         else:
-            # Human-readable output
-            click.echo()
-            click.secho("GatomIA Configuration", fg="blue", bold=True)
-            click.echo("━" * 40)
-            click.echo()
+            # Human-readable output, collected and written in one go
+            lines: List[str] = []
+
+            def line(text: str = "", **style) -> None:
+                lines.append(click.style(text, **style) if style else text)
+
+            line()
+            line("GatomIA Configuration", fg="blue", bold=True)
+            line("━" * 40)
+            line()
 
-            click.secho("Credentials", fg="cyan", bold=True)
+            line("Credentials", fg="cyan", bold=True)
             if api_key:
                 storage = "system keychain" if manager.keyring_available else "encrypted file"
-                click.echo(f"  API Key:          {mask_api_key(api_key)} (in {storage})")
+                line(f"  API Key:          {mask_api_key(api_key)} (in {storage})")
             else:
-                click.secho("  API Key:          Not set", fg="yellow")
+                line("  API Key:          Not set", fg="yellow")
 
             if config and config.copilot_token:
-                click.echo(f"  Copilot Token:    {mask_api_key(config.copilot_token)}")
+                line(f"  Copilot Token:    {mask_api_key(config.copilot_token)}")
 
-            click.echo()
-            click.secho("API Settings", fg="cyan", bold=True)
+            line()
+            line("API Settings", fg="cyan", bold=True)
             if config:
-                click.echo(f"  Provider:         {config.llm_provider or 'openai'}")
-                click.echo(f"  Base URL:         {config.base_url or 'Not set'}")
-                click.echo(f"  Main Model:       {config.main_model or 'Not set'}")
-                click.echo(f"  Cluster Model:    {config.cluster_model or 'Not set'}")
-                click.echo(f"  Fallback Model:   {config.fallback_model or 'Not set'}")
-                click.echo(f"  Include Reasoning: {config.include_reasoning}")
+                line(f"  Provider:         {config.llm_provider or 'openai'}")
+                line(f"  Base URL:         {config.base_url or 'Not set'}")
+                line(f"  Main Model:       {config.main_model or 'Not set'}")
+                line(f"  Cluster Model:    {config.cluster_model or 'Not set'}")
+                line(f"  Fallback Model:   {config.fallback_model or 'Not set'}")
+                line(f"  Include Reasoning: {config.include_reasoning}")
             else:
-                click.secho("  Not configured", fg="yellow")
+                line("  Not configured", fg="yellow")
 
-            click.echo()
-            click.secho("Output Settings", fg="cyan", bold=True)
+            line()
+            line("Output Settings", fg="cyan", bold=True)
             if config:
-                click.echo(f"  Default Output:   {config.default_output}")
+                line(f"  Default Output:   {config.default_output}")
 
-            click.echo()
-            click.secho("Token Settings", fg="cyan", bold=True)
+            line()
+            line("Token Settings", fg="cyan", bold=True)
             if config:
-                click.echo(f"  Max Tokens:              {config.max_tokens}")
-                click.echo(f"  Max Token/Module:        {config.max_token_per_module}")
-                click.echo(f"  Max Token/Leaf Module:   {config.max_token_per_leaf_module}")
+                line(f"  Max Tokens:              {config.max_tokens}")
+                line(f"  Max Token/Module:        {config.max_token_per_module}")
+                line(f"  Max Token/Leaf Module:   {config.max_token_per_leaf_module}")
 
-            click.echo()
-            click.secho("Decomposition Settings", fg="cyan", bold=True)
+            line()
+            line("Decomposition Settings", fg="cyan", bold=True)
             if config:
-                click.echo(f"  Max Depth:               {config.max_depth}")
+                line(f"  Max Depth:               {config.max_depth}")
 
-            click.echo()
-            click.secho("Agent Instructions", fg="cyan", bold=True)
+            line()
+            line("Agent Instructions", fg="cyan", bold=True)
             if config and config.agent_instructions and not config.agent_instructions.is_empty():
-                agent = config.agent_instructions
-                if agent.include_patterns:
-                    click.echo(f"  Include patterns:   {', '.join(agent.include_patterns)}")
-                if agent.exclude_patterns:
-                    click.echo(f"  Exclude patterns:   {', '.join(agent.exclude_patterns)}")
-                if agent.focus_modules:
-                    click.echo(f"  Focus modules:      {', '.join(agent.focus_modules)}")
-                if agent.doc_type:
-                    click.echo(f"  Doc type:           {agent.doc_type}")
-                if agent.custom_instructions:
-                    click.echo(f"  Custom instructions: {agent.custom_instructions[:50]}...")
+                lines.extend(_render_agent_lines(config.agent_instructions, instructions_limit=50))
             else:
-                click.secho("  Using defaults (no custom settings)", fg="yellow")
+                line("  Using defaults (no custom settings)", fg="yellow")
 
-            click.echo()
-            click.echo(f"Configuration file: {manager.config_file_path}")
-            click.echo()
+            line()
+            line(f"Configuration file: {manager.config_file_path}")
+            line()
+
+            click.echo("\n".join(lines))
 
     except Exception as e:
         sys.exit(handle_error(e))
@@ -420,19 +438,24 @@ def config_validate(quick: bool, verbose: bool):
     # Verbose output
     $ gatomia config validate --verbose
     """
+    from gatomia.cli.config_manager import ConfigManager
+    from gatomia.cli.utils.validation import validate_url, is_top_tier_model
+
     try:
         click.echo()
         click.secho("Validating configuration...", fg="blue", bold=True)
         click.echo()
 
-        manager = ConfigManager()
+        manager = ConfigManager.get_shared()
 
         # Step 1: Check config file
         if verbose:
-            click.echo("[1/5] Checking configuration file...")
-            click.echo(f"      Path: {manager.config_file_path}")
+            click.echo(
+                "[1/5] Checking configuration file...\n"
+                f"      Path: {manager.config_file_path}"
+            )
 
-        if not manager.load():
+        if manager.get_config() is None:
             click.secho("✗ Configuration file not found", fg="red")
             click.echo()
             click.echo(
@@ -441,17 +464,14 @@ def config_validate(quick: bool, verbose: bool):
             sys.exit(EXIT_CONFIG_ERROR)
 
         if verbose:
-            click.secho("      ✓ File exists", fg="green")
-            click.secho("      ✓ Valid JSON format", fg="green")
+            click.secho("      ✓ File exists\n      ✓ Valid JSON format", fg="green")
         else:
             click.secho("✓ Configuration file exists", fg="green")
 
         # Step 2: Check API key
         if verbose:
-            click.echo()
-            click.echo("[2/5] Checking API key...")
             storage = "system keychain" if manager.keyring_available else "encrypted file"
-            click.echo(f"      Storage: {storage}")
+            click.echo(f"\n[2/5] Checking API key...\n      Storage: {storage}")
 
         api_key = manager.get_api_key()
         config = manager.get_config()
@@ -463,8 +483,10 @@ def config_validate(quick: bool, verbose: bool):
 
         if api_key:
             if verbose:
-                click.secho(f"      ✓ API key retrieved", fg="green")
-                click.secho(f"      ✓ Length: {len(api_key)} characters", fg="green")
+                click.secho(
+                    f"      ✓ API key retrieved\n      ✓ Length: {len(api_key)} characters",
+                    fg="green",
+                )
             else:
                 click.secho("✓ API key present (stored in keychain)", fg="green")
         elif config.llm_provider == "copilot":
@@ -474,11 +496,8 @@ def config_validate(quick: bool, verbose: bool):
                 click.secho("✓ API key not required for Copilot", fg="green")
 
         # Step 3: Check base URL
-        config = manager.get_config()
         if verbose:
-            click.echo()
-            click.echo("[3/5] Checking base URL...")
-            click.echo(f"      URL: {config.base_url}")
+            click.echo(f"\n[3/5] Checking base URL...\n      URL: {config.base_url}")
 
         if not config.base_url and config.llm_provider == "openai":
             click.secho("✗ Base URL not set", fg="red")
@@ -500,11 +519,12 @@ def config_validate(quick: bool, verbose: bool):
 
         # Step 4: Check models
         if verbose:
-            click.echo()
-            click.echo("[4/5] Checking model configuration...")
-            click.echo(f"      Main model: {config.main_model}")
-            click.echo(f"      Cluster model: {config.cluster_model}")
-            click.echo(f"      Fallback model: {config.fallback_model}")
+            click.echo(
+                "\n[4/5] Checking model configuration...\n"
+                f"      Main model: {config.main_model}\n"
+                f"      Cluster model: {config.cluster_model}\n"
+                f"      Fallback model: {config.fallback_model}"
+            )
 
         if not config.main_model or not config.cluster_model or not config.fallback_model:
             click.secho("✗ Models not configured", fg="red")
@@ -513,9 +533,12 @@ def config_validate(quick: bool, verbose: bool):
         if verbose:
             click.secho("      ✓ Models configured", fg="green")
         else:
-            click.secho(f"✓ Main model configured: {config.main_model}", fg="green")
-            click.secho(f"✓ Cluster model configured: {config.cluster_model}", fg="green")
-            click.secho(f"✓ Fallback model configured: {config.fallback_model}", fg="green")
+            click.secho(
+                f"✓ Main model configured: {config.main_model}\n"
+                f"✓ Cluster model configured: {config.cluster_model}\n"
+                f"✓ Fallback model configured: {config.fallback_model}",
+                fg="green",
+            )
 
         # Warn about non-top-tier cluster model
         if not is_top_tier_model(config.cluster_model):
@@ -664,10 +687,13 @@ def config_agent(
     # Clear all agent instructions
     $ gatomia config agent --clear
     """
+    from gatomia.cli.config_manager import ConfigManager
+    from gatomia.cli.models.config import AgentInstructions
+
     try:
-        manager = ConfigManager()
+        manager = ConfigManager.get_shared()
 
-        if not manager.load():
+        if manager.get_config() is None:
             click.secho("\n✗ Configuration not found.", fg="red", err=True)
             click.echo("\nPlease run 'gatomia config set' first to configure your API credentials.")
             sys.exit(EXIT_CONFIG_ERROR)
@@ -684,7 +710,7 @@ def config_agent(
             return
 
         # Check if at least one option is provided
-        if not any([include, exclude, focus, doc_type, instructions]):
+        if not (include or exclude or focus or doc_type or instructions):
             # Display current settings
             click.echo()
             click.secho("Agent Instructions", fg="blue", bold=True)
@@ -693,16 +719,7 @@ def config_agent(
 
             agent = config.agent_instructions
             if agent and not agent.is_empty():
-                if agent.include_patterns:
-                    click.echo(f"  Include patterns:   {', '.join(agent.include_patterns)}")
-                if agent.exclude_patterns:
-                    click.echo(f"  Exclude patterns:   {', '.join(agent.exclude_patterns)}")
-                if agent.focus_modules:
-                    click.echo(f"  Focus modules:      {', '.join(agent.focus_modules)}")
-                if agent.doc_type:
-                    click.echo(f"  Doc type:           {agent.doc_type}")
-                if agent.custom_instructions:
-                    click.echo(f"  Custom instructions: {agent.custom_instructions}")
+                click.echo("\n".join(_render_agent_lines(agent)))
             else:
                 click.secho("  No agent instructions configured (using defaults)", fg="yellow")
 
@@ -714,12 +731,17 @@ def config_agent(
         # Update agent instructions
         current = config.agent_instructions or AgentInstructions()
 
+        # Parse each option once; the result is reused in the messages below
+        include_list = parse_patterns(include) if include else None
+        exclude_list = parse_patterns(exclude) if exclude else None
+        focus_list = parse_patterns(focus) if focus else None
+
         if include is not None:
-            current.include_patterns = parse_patterns(include) if include else None
+            current.include_patterns = include_list
         if exclude is not None:
-            current.exclude_patterns = parse_patterns(exclude) if exclude else None
+            current.exclude_patterns = exclude_list
         if focus is not None:
-            current.focus_modules = parse_patterns(focus) if focus else None
+            current.focus_modules = focus_list
         if doc_type is not None:
             current.doc_type = doc_type if doc_type else None
         if instructions is not None:
@@ -731,11 +753,11 @@ def config_agent(
         # Display success messages
         click.echo()
         if include:
-            click.secho(f"✓ Include patterns: {parse_patterns(include)}", fg="green")
+            click.secho(f"✓ Include patterns: {include_list}", fg="green")
         if exclude:
-            click.secho(f"✓ Exclude patterns: {parse_patterns(exclude)}", fg="green")
+            click.secho(f"✓ Exclude patterns: {exclude_list}", fg="green")
         if focus:
-            click.secho(f"✓ Focus modules: {parse_patterns(focus)}", fg="green")
+            click.secho(f"✓ Focus modules: {focus_list}", fg="green")
         if doc_type:
             click.secho(f"✓ Doc type: {doc_type}", fg="green")
         if instructions:
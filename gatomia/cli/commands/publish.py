@@ -2,22 +2,140 @@
 Publish command for documentation generation to GitHub Wiki.
 """
 
+import contextlib
+import getpass
+import hashlib
 import os
 import sys
 import shutil
+import socket
+import subprocess
 import tempfile
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 import click
-import git
-from git.exc import GitCommandError
 
 from gatomia.cli.git_manager import GitManager
 from gatomia.cli.utils.errors import RepositoryError, handle_error, EXIT_SUCCESS
 from gatomia.cli.utils.logging import create_logger
 
 
+COMMIT_MESSAGE = "Update documentation via GatomIA CLI"
+
+# Below this many files a thread pool costs more than it saves
+PARALLEL_COPY_THRESHOLD = 32
+
+# Wiki clones are kept here, one directory per wiki URL
+WIKI_CACHE_DIR = Path.home() / ".cache" / "gatomia" / "wiki"
+
+
+def _wiki_cache_path(wiki_url: str) -> Path:
+    """Get the cache directory for a wiki URL."""
+    return WIKI_CACHE_DIR / hashlib.sha1(wiki_url.encode()).hexdigest()[:16]
+
+
+def _collect_docs(input_dir: Path) -> List[Tuple[str, str]]:
+    """
+    List the files of the documentation tree in a single walk.
+
+    Returns:
+        (absolute source path, path relative to input_dir) for every file
+    """
+    docs = []
+    for dirpath, _, filenames in os.walk(input_dir):
+        rel_dir = os.path.relpath(dirpath, input_dir)
+        docs.extend(
+            (os.path.join(dirpath, name), os.path.normpath(os.path.join(rel_dir, name)))
+            for name in filenames
+        )
+    return docs
+
+
+def _copy_docs(docs: List[Tuple[str, str]], wiki_path: Path, logger, verbose: bool) -> int:
+    """
+    Copy the collected documentation files into the wiki clone.
+
+    Target directories are created up front; the file copies then run on a
+    thread pool, since copy2 releases the GIL while the OS moves the bytes.
+
+    Returns:
+        Number of files copied
+    """
+    for rel_dir in {os.path.dirname(rel_path) for _, rel_path in docs}:
+        (wiki_path / rel_dir).mkdir(parents=True, exist_ok=True)
+
+    def copy(doc):
+        src, rel_path = doc
+        shutil.copy2(src, wiki_path / rel_path)
+        return rel_path
+
+    if len(docs) < PARALLEL_COPY_THRESHOLD:
+        copied = list(map(copy, docs))
+    else:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            copied = list(executor.map(copy, docs))
+
+    if verbose:
+        for rel_path in copied:
+            logger.debug(f"Copied {rel_path}")
+
+    return len(copied)
+
+
+def _refresh_cached_wiki(repo_path: Path) -> bool:
+    """
+    Bring a cached wiki clone in line with the remote.
+
+    Args:
+        repo_path: Path of the cached clone
+
+    Returns:
+        True if the clone is usable, False if it is missing or corrupt
+    """
+    if not (repo_path / ".git").is_dir():
+        return False
+
+    for args in (
+        ("rev-parse", "--verify", "-q", "HEAD"),
+        ("fetch", "-q", "--depth=1", "--no-tags", "origin"),
+        ("reset", "-q", "--hard", "FETCH_HEAD"),
+        ("clean", "-q", "-fdx"),
+    ):
+        result = subprocess.run(["git", "-C", str(repo_path), *args], capture_output=True)
+        if result.returncode != 0:
+            return False
+    return True
+
+
+def _identity_overrides(repo_path: Path) -> List[str]:
+    """
+    Build ``-c key=value`` arguments for any committer identity git lacks.
+
+    Args:
+        repo_path: Repository the commit will be made in
+
+    Returns:
+        Arguments to place before the git subcommand; empty when both are configured
+    """
+    # Same user@hostname fallback GitPython used when committing
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = "gatomia"
+    fallbacks = {"user.name": user, "user.email": f"{user}@{socket.gethostname()}"}
+
+    overrides: List[str] = []
+    for key, fallback in fallbacks.items():
+        configured = subprocess.run(
+            ["git", "-C", str(repo_path), "config", "--get", key], capture_output=True
+        )
+        if configured.returncode != 0 or not configured.stdout.strip():
+            overrides += ["-c", f"{key}={fallback}"]
+    return overrides
+
+
 @click.command(name="publish")
 @click.option(
     "--input",
@@ -76,13 +194,14 @@ def publish_command(
                 f"Input directory does not exist or is not a directory: {input_dir}"
             )
 
-        # Check for markdown files
-        md_files = list(input_dir.rglob("*.md"))
-        if not md_files:
+        # One walk serves both the Markdown check and the copy below
+        docs = _collect_docs(input_dir)
+        md_count = sum(1 for _, rel_path in docs if rel_path.endswith(".md"))
+        if not md_count:
             logger.warning(f"No Markdown files found in {input_dir}. Nothing to publish.")
             sys.exit(EXIT_SUCCESS)
 
-        logger.success(f"Found {len(md_files)} Markdown files to publish")
+        logger.success(f"Found {md_count} Markdown files to publish")
 
         logger.step("Determining Wiki URL...", 2, 4)
         if wiki_url:
@@ -108,71 +227,97 @@ def publish_command(
         logger.success(f"Using Wiki URL: {target_wiki_url}")
 
         logger.step("Cloning Wiki repository...", 3, 4)
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_repo_path = Path(temp_dir) / "wiki"
-
+        with contextlib.ExitStack() as stack:
+            # Keep the clone between publishes so later runs only fetch the delta
+            wiki_path = _wiki_cache_path(target_wiki_url)
             try:
+                wiki_path.parent.mkdir(parents=True, exist_ok=True)
+            except OSError:
+                temp_dir = stack.enter_context(tempfile.TemporaryDirectory())
+                wiki_path = Path(temp_dir) / "wiki"
+
+            if _refresh_cached_wiki(wiki_path):
+                logger.success("Reusing cached Wiki clone")
+            else:
+                shutil.rmtree(wiki_path, ignore_errors=True)
                 if verbose:
-                    logger.debug(f"Cloning {target_wiki_url} into {temp_repo_path}")
-                repo = git.Repo.clone_from(target_wiki_url, temp_repo_path)
-            except GitCommandError as e:
-                raise RepositoryError(
-                    f"Failed to clone Wiki repository.\n\n"
-                    f"Ensure the Wiki feature is enabled in your GitHub repository settings, "
-                    f"and that the URL is correct and accessible.\n\n"
-                    f"Error details: {e}"
+                    logger.debug(f"Cloning {target_wiki_url} into {wiki_path}")
+                # Only the current tree is needed to overwrite pages and push a commit
+                cloned = subprocess.run(
+                    [
+                        "git",
+                        "clone",
+                        "-q",
+                        "--depth=1",
+                        "--single-branch",
+                        "--no-tags",
+                        target_wiki_url,
+                        str(wiki_path),
+                    ],
+                    capture_output=True,
+                    text=True,
                 )
+                if cloned.returncode != 0:
+                    raise RepositoryError(
+                        f"Failed to clone Wiki repository.\n\n"
+                        f"Ensure the Wiki feature is enabled in your GitHub repository settings, "
+                        f"and that the URL is correct and accessible.\n\n"
+                        f"Error details: {cloned.stderr.strip()}"
+                    )
 
-            logger.success("Wiki repository cloned successfully")
+                logger.success("Wiki repository cloned successfully")
 
             logger.step("Publishing documentation...", 4, 4)
 
-            # Copy all files from input_dir to the root of the wiki temp_repo_path
+            # Copy all files from input_dir to the root of the wiki wiki_path
             # Warning: GitHub Wiki expects flat markdown files or specific folder structures.
-            files_copied = 0
-            for item in input_dir.rglob("*"):
-                if item.is_file():
-                    # Preserve relative path but copy to wiki root path
-                    rel_path = item.relative_to(input_dir)
-                    target_path = temp_repo_path / rel_path
-
-                    # Ensure target directory exists
-                    target_path.parent.mkdir(parents=True, exist_ok=True)
-
-                    shutil.copy2(item, target_path)
-                    files_copied += 1
-                    if verbose:
-                        logger.debug(f"Copied {rel_path}")
+            files_copied = _copy_docs(docs, wiki_path, logger, verbose)
 
             if files_copied == 0:
                 logger.warning("No files were copied.")
                 sys.exit(EXIT_SUCCESS)
 
-            # Check if there are changes to commit
-            if not repo.is_dirty(untracked_files=True):
+            # Stage everything, then compare the index with HEAD. diff-index exits
+            # at the first difference instead of scanning for untracked files.
+            staged = subprocess.run(
+                ["git", "add", "-A"], cwd=wiki_path, capture_output=True, text=True
+            )
+            if staged.returncode != 0:
+                raise RepositoryError(f"Failed to stage changes: {staged.stderr.strip()}")
+            has_changes = (
+                subprocess.call(
+                    ["git", "diff-index", "--quiet", "--cached", "HEAD", "--"],
+                    cwd=wiki_path,
+                    stderr=subprocess.DEVNULL,
+                )
+                != 0
+            )
+            if not has_changes:
                 logger.info("No changes to publish. Wiki is up to date.")
                 sys.exit(EXIT_SUCCESS)
 
-            try:
-                # Add all files
-                repo.git.add(A=True)
-
-                # Commit
-                commit_message = "Update documentation via GatomIA CLI"
-                repo.index.commit(commit_message)
-
-                # Push
-                if verbose:
-                    logger.debug("Pushing changes to remote Wiki repository")
-                origin = repo.remote(name="origin")
-                origin.push()
-
-                logger.success(
-                    f"Successfully published {files_copied} files to the Wiki repository."
-                )
+            if verbose:
+                logger.debug("Committing and pushing changes to remote Wiki repository")
+            committed = subprocess.run(
+                ["git", *_identity_overrides(wiki_path), "commit", "-q", "-m", COMMIT_MESSAGE],
+                cwd=wiki_path,
+                capture_output=True,
+                text=True,
+            )
+            if committed.returncode != 0:
+                details = committed.stderr.strip() or committed.stdout.strip()
+                raise RepositoryError(f"Failed to commit changes: {details}")
+            pushed = subprocess.run(
+                ["git", "push", "-q", "origin", "HEAD"],
+                cwd=wiki_path,
+                capture_output=True,
+                text=True,
+            )
+            if pushed.returncode != 0:
+                details = pushed.stderr.strip() or pushed.stdout.strip()
+                raise RepositoryError(f"Failed to push changes: {details}")
 
-            except GitCommandError as e:
-                raise RepositoryError(f"Failed to commit or push changes: {e}")
+            logger.success(f"Successfully published {files_copied} files to the Wiki repository.")
 
     except RepositoryError as e:
         logger.error(e.message)
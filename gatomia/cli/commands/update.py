@@ -22,6 +22,7 @@ from gatomia.cli.utils.repo_validator import (
 )
 from gatomia.cli.utils.logging import create_logger
 from gatomia.cli.adapters.doc_updater import CLIDocumentationUpdater
+from gatomia.src.be.llm_services import close_llm_clients
 
 
 @click.command(name="update")
@@ -46,17 +47,31 @@ from gatomia.cli.adapters.doc_updater import CLIDocumentationUpdater
     is_flag=True,
     help="Force re-analysis of dependencies before updating",
 )
+@click.option(
+    "--no-context",
+    is_flag=True,
+    help="Skip loading the module tree and dependency graph (faster for small edits)",
+)
+@click.option(
+    "--interactive",
+    "-I",
+    is_flag=True,
+    help="Keep the session open for further updates, reusing the loaded context",
+)
 def update_command(
     pattern: str,
     instruction: Optional[str],
     output: str,
     verbose: bool,
     refresh: bool,
+    no_context: bool,
+    interactive: bool,
 ):
     """
     Update documentation using natural language.
 
     PATTERN: Partial filename to identify the document (e.g., 'wallet_domain').
+             Separate several patterns with commas to update them concurrently.
     INSTRUCTION: What to change (e.g., 'Add a diagram showing x').
                  If not provided, you will be prompted.
     """
@@ -116,14 +131,30 @@ def update_command(
                 "max_tokens": config.max_tokens,
             },
             verbose=verbose,
+            include_context=not no_context,
         )
 
         logger.step("Updating documentation...", 1, 1)
 
-        # Run update
-        updated_file = asyncio.run(updater.update_document(pattern, instruction, refresh=refresh))
-
-        logger.success(f"Successfully updated: {updated_file}")
+        # One event loop for the whole session, so interactive follow-ups reuse it
+        # along with the updater's cached context.
+        with asyncio.Runner() as runner:
+            try:
+                _run_update(runner, updater, logger, pattern, instruction, refresh)
+
+                while interactive:
+                    pattern = click.prompt(
+                        "Next document pattern (empty to quit)", default="", show_default=False
+                    )
+                    if not pattern.strip():
+                        break
+                    instruction = click.prompt("Please enter your update instruction")
+                    try:
+                        _run_update(runner, updater, logger, pattern, instruction, refresh=False)
+                    except APIError as e:
+                        logger.error(str(e))
+            finally:
+                runner.run(close_llm_clients())
 
     except ConfigurationError as e:
         logger.error(e.message)
@@ -133,3 +164,25 @@ def update_command(
         sys.exit(1)
     except Exception as e:
         sys.exit(handle_error(e, verbose=verbose))
+
+
+def _run_update(
+    runner: asyncio.Runner,
+    updater: CLIDocumentationUpdater,
+    logger,
+    pattern: str,
+    instruction: str,
+    refresh: bool,
+) -> None:
+    """Run one update request on the session's event loop."""
+    # Comma-separated patterns are updated concurrently
+    patterns = [p.strip() for p in pattern.split(",") if p.strip()]
+    if len(patterns) > 1:
+        updated_files = runner.run(
+            updater.update_documents_batch([(p, instruction) for p in patterns], refresh=refresh)
+        )
+    else:
+        updated_files = [runner.run(updater.update_document(pattern, instruction, refresh=refresh))]
+
+    for updated_file in updated_files:
+        logger.success(f"Successfully updated: {updated_file}")
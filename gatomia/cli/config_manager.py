@@ -4,7 +4,7 @@ Configuration manager with keyring integration for secure credential storage.
 
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 import keyring
 from keyring.errors import KeyringError
 
@@ -22,6 +22,9 @@ CONFIG_DIR = Path.home() / ".gatomia"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 CONFIG_VERSION = "1.0"
 
+# Default for save() arguments, so "not supplied" is distinct from an explicit None
+_UNSET: Any = object()
+
 
 class ConfigManager:
     """
@@ -33,9 +36,42 @@ class ConfigManager:
         - Other settings: ~/.gatomia/config.json
     """
 
+    # Process-wide instance handed out by get_shared(), and the config file
+    # mtime it was loaded at (None when the file did not exist)
+    _instance: Optional["ConfigManager"] = None
+    _loaded_mtime_ns: Optional[int] = None
+
+    @classmethod
+    def get_shared(cls) -> "ConfigManager":
+        """
+        Get the shared, loaded configuration manager.
+
+        The config file is only re-read when its modification time changed
+        since the last load, so repeated calls skip the parse and keychain read.
+        Check get_config() for None to detect a missing configuration.
+
+        Returns:
+            Shared ConfigManager instance
+        """
+        try:
+            mtime_ns = CONFIG_FILE.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+
+        instance = cls._instance
+        if instance is None or mtime_ns is None or mtime_ns != cls._loaded_mtime_ns:
+            instance = cls()
+            instance.load()
+            cls._instance = instance
+            cls._loaded_mtime_ns = mtime_ns
+
+        return instance
+
     def __init__(self):
         """Initialize the configuration manager."""
         self._api_key: Optional[str] = None
+        # Keychain reads are synchronous IPC; remember lookups (even misses) per process
+        self._api_key_loaded = False
         self._config: Optional[Configuration] = None
         self._keyring_available = self._check_keyring_available()
 
@@ -70,12 +106,8 @@ class ConfigManager:
 
             self._config = Configuration.from_dict(data)
 
-            # Load API key from keyring
-            try:
-                self._api_key = keyring.get_password(KEYRING_SERVICE, KEYRING_API_KEY_ACCOUNT)
-            except KeyringError:
-                # Keyring unavailable, API key will be None
-                pass
+            # Load API key from keyring (once per process)
+            self.get_api_key()
 
             return True
         except (json.JSONDecodeError, FileSystemError) as e:
@@ -83,23 +115,27 @@ class ConfigManager:
 
     def save(
         self,
-        api_key: Optional[str] = None,
-        base_url: Optional[str] = None,
-        main_model: Optional[str] = None,
-        cluster_model: Optional[str] = None,
-        fallback_model: Optional[str] = None,
-        llm_provider: Optional[str] = None,
-        copilot_token: Optional[str] = None,
-        default_output: Optional[str] = None,
-        max_tokens: Optional[int] = None,
-        max_token_per_module: Optional[int] = None,
-        max_token_per_leaf_module: Optional[int] = None,
-        max_depth: Optional[int] = None,
-        include_reasoning: Optional[bool] = None,
+        api_key: Optional[str] = _UNSET,
+        base_url: Optional[str] = _UNSET,
+        main_model: Optional[str] = _UNSET,
+        cluster_model: Optional[str] = _UNSET,
+        fallback_model: Optional[str] = _UNSET,
+        llm_provider: Optional[str] = _UNSET,
+        copilot_token: Optional[str] = _UNSET,
+        default_output: Optional[str] = _UNSET,
+        max_tokens: Optional[int] = _UNSET,
+        max_token_per_module: Optional[int] = _UNSET,
+        max_token_per_leaf_module: Optional[int] = _UNSET,
+        max_depth: Optional[int] = _UNSET,
+        include_reasoning: Optional[bool] = _UNSET,
     ):
         """
         Save configuration to file and keyring.
 
+        Only the fields that are passed are updated; omitted fields keep their
+        current value. Passing None explicitly stores None (e.g. to clear
+        include_reasoning).
+
         Args:
             api_key: API key (stored in keyring)
             base_url: LLM API base URL
@@ -113,6 +149,7 @@ class ConfigManager:
             max_token_per_module: Maximum tokens per module for clustering
             max_token_per_leaf_module: Maximum tokens per leaf module
             max_depth: Maximum depth for hierarchical decomposition
+            include_reasoning: Enable OpenRouter reasoning tokens
         """
         # Ensure config directory exists
         try:
@@ -137,40 +174,35 @@ class ConfigManager:
                 )
 
         # Update fields if provided
-        if base_url is not None:
-            self._config.base_url = base_url
-        if main_model is not None:
-            self._config.main_model = main_model
-        if cluster_model is not None:
-            self._config.cluster_model = cluster_model
-        if fallback_model is not None:
-            self._config.fallback_model = fallback_model
-        if llm_provider is not None:
-            self._config.llm_provider = llm_provider
-        if copilot_token is not None:
-            self._config.copilot_token = copilot_token
-        if default_output is not None:
-            self._config.default_output = default_output
-        if max_tokens is not None:
-            self._config.max_tokens = max_tokens
-        if max_token_per_module is not None:
-            self._config.max_token_per_module = max_token_per_module
-        if max_token_per_leaf_module is not None:
-            self._config.max_token_per_leaf_module = max_token_per_leaf_module
-        if max_depth is not None:
-            self._config.max_depth = max_depth
-        if include_reasoning is not None:
-            self._config.include_reasoning = include_reasoning
+        updates = {
+            "base_url": base_url,
+            "main_model": main_model,
+            "cluster_model": cluster_model,
+            "fallback_model": fallback_model,
+            "llm_provider": llm_provider,
+            "copilot_token": copilot_token,
+            "default_output": default_output,
+            "max_tokens": max_tokens,
+            "max_token_per_module": max_token_per_module,
+            "max_token_per_leaf_module": max_token_per_leaf_module,
+            "max_depth": max_depth,
+            "include_reasoning": include_reasoning,
+        }
+        for name, value in updates.items():
+            if value is not _UNSET:
+                setattr(self._config, name, value)
 
         # Validate configuration (only if base fields are set)
         if self._config.base_url and self._config.main_model and self._config.cluster_model:
             self._config.validate()
 
         # Save API key to keyring
-        if api_key is not None:
-            self._api_key = api_key
+        if api_key is not _UNSET and api_key is not None:
+            self._invalidate_api_key()
             try:
                 keyring.set_password(KEYRING_SERVICE, KEYRING_API_KEY_ACCOUNT, api_key)
+                self._api_key = api_key
+                self._api_key_loaded = True
             except KeyringError as e:
                 # Fallback: warn about keyring unavailability
                 raise ConfigurationError(
@@ -186,21 +218,34 @@ class ConfigManager:
         except FileSystemError as e:
             raise ConfigurationError(f"Failed to save configuration: {e}")
 
+        # The shared instance may now be stale
+        ConfigManager._instance = None
+
     def get_api_key(self) -> Optional[str]:
         """
         Get API key from keyring.
 
+        The keychain is queried at most once; later calls return the cached
+        result until the key is saved or deleted.
+
         Returns:
             API key or None if not set
         """
-        if self._api_key is None:
+        if not self._api_key_loaded:
             try:
                 self._api_key = keyring.get_password(KEYRING_SERVICE, KEYRING_API_KEY_ACCOUNT)
             except KeyringError:
-                pass
+                # Keyring unavailable, API key will be None
+                self._api_key = None
+            self._api_key_loaded = True
 
         return self._api_key
 
+    def _invalidate_api_key(self):
+        """Drop the cached API key so the next read goes back to the keychain."""
+        self._api_key = None
+        self._api_key_loaded = False
+
     def get_config(self) -> Optional[Configuration]:
         """
         Get current configuration.
@@ -229,9 +274,9 @@ class ConfigManager:
 
     def delete_api_key(self):
         """Delete API key from keyring."""
+        self._invalidate_api_key()
         try:
             keyring.delete_password(KEYRING_SERVICE, KEYRING_API_KEY_ACCOUNT)
-            self._api_key = None
         except KeyringError:
             pass
 
@@ -245,7 +290,8 @@ class ConfigManager:
             CONFIG_FILE.unlink()
 
         self._config = None
-        self._api_key = None
+        self._invalidate_api_key()
+        ConfigManager._instance = None
 
     @property
     def keyring_available(self) -> bool:
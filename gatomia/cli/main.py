@@ -2,13 +2,39 @@
 Main CLI application for GatomIA using Click framework.
 """
 
+import importlib
 import sys
 import click
 
 from gatomia import __version__
 
 
-@click.group()
+# Commands are imported on first use, so `--version`/`--help` skip the backend imports
+LAZY_COMMANDS = {
+    "config": ("gatomia.cli.commands.config", "config_group"),
+    "generate": ("gatomia.cli.commands.generate", "generate_command"),
+    "analyze": ("gatomia.cli.commands.analyze", "analyze_command"),
+    "update": ("gatomia.cli.commands.update", "update_command"),
+    "publish": ("gatomia.cli.commands.publish", "publish_command"),
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules only when they are invoked."""
+
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *LAZY_COMMANDS})
+
+    def get_command(self, ctx, cmd_name):
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in LAZY_COMMANDS:
+            module_name, attr_name = LAZY_COMMANDS[cmd_name]
+            command = getattr(importlib.import_module(module_name), attr_name)
+            self.add_command(command, name=cmd_name)
+        return command
+
+
+@click.group(cls=LazyGroup)
 @click.version_option(version=__version__, prog_name="GatomIA CLI")
 @click.pass_context
 def cli(ctx):
@@ -29,21 +55,6 @@ def version():
     click.echo("Python-based documentation generator using AI analysis")
 
 
-# Import commands
-from gatomia.cli.commands.config import config_group
-from gatomia.cli.commands.generate import generate_command
-from gatomia.cli.commands.analyze import analyze_command
-from gatomia.cli.commands.update import update_command
-from gatomia.cli.commands.publish import publish_command
-
-# Register command groups
-cli.add_command(config_group)
-cli.add_command(generate_command, name="generate")
-cli.add_command(analyze_command, name="analyze")
-cli.add_command(update_command, name="update")
-cli.add_command(publish_command, name="publish")
-
-
 def main():
     """Entry point for the CLI."""
     try:
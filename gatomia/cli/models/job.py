@@ -9,6 +9,8 @@ from enum import Enum
 import uuid
 import json
 
+from gatomia.src.config import DEFAULT_LLM_CONCURRENCY
+
 
 class JobStatus(str, Enum):
     """Documentation job status."""
@@ -42,6 +44,7 @@ class LLMConfig:
     main_model: str
     cluster_model: str
     base_url: str
+    concurrency: int = DEFAULT_LLM_CONCURRENCY
 
 
 @dataclass
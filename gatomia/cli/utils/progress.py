@@ -47,6 +47,17 @@ class RichProgressTracker:
         self.current_stage = 0
         self.stage_progress = 0.0
 
+        # Minimum seconds between forwarded update_stage redraws
+        self._min_interval = 1 / 30
+        self._last_update = 0.0
+
+        # Weight of all stages before each stage, so progress updates are O(1)
+        self._stage_prefix = {}
+        completed_weight = 0.0
+        for stage in range(1, max(self.STAGE_WEIGHTS) + 2):
+            self._stage_prefix[stage] = completed_weight
+            completed_weight += self.STAGE_WEIGHTS.get(stage, 0)
+
         # Initialize Rich Progress
         self.progress = Progress(
             SpinnerColumn(),
@@ -79,27 +90,30 @@ class RichProgressTracker:
         )
 
         # Calculate overall progress base
-        overall_base = sum(self.STAGE_WEIGHTS.get(s, 0) for s in range(1, self.current_stage)) * 100
+        overall_base = self._completed_weight() * 100
         self.progress.update(self.overall_task_id, completed=overall_base)
 
     def update_stage(self, progress: float, message: Optional[str] = None):
         """Update progress within current stage."""
         self.stage_progress = min(1.0, max(0.0, progress))
 
-        # Update stage bar (0-100)
-        self.progress.update(self.current_stage_task_id, completed=self.stage_progress * 100)
-
-        if message:
-            # Append message to description or print it?
-            # For a cleaner UI, let's keep the main description static and maybe use console.print for details if verbose
-            if self.verbose:
-                self.console.print(f"[dim]{message}[/dim]")
-            else:
-                # Update description temporarily? No, might flicker.
-                self.progress.update(
-                    self.current_stage_task_id,
-                    description=f"[bold blue]{self.STAGE_NAMES.get(self.current_stage)}: {message}",
-                )
+        if message and self.verbose:
+            self.console.print(f"[dim]{message}[/dim]")
+
+        # Cached modules can report thousands of updates a second; only redraw
+        # at a bounded rate, but always let the final update through
+        now = time.monotonic()
+        if self.stage_progress < 1.0 and now - self._last_update < self._min_interval:
+            return
+        self._last_update = now
+
+        # Update stage bar (0-100), showing the latest message next to the stage name
+        stage_update = {"completed": self.stage_progress * 100}
+        if message and not self.verbose:
+            stage_update["description"] = (
+                f"[bold blue]{self.STAGE_NAMES.get(self.current_stage)}: {message}"
+            )
+        self.progress.update(self.current_stage_task_id, **stage_update)
 
         # Update overall bar
         overall_progress = self.get_overall_progress() * 100
@@ -116,9 +130,17 @@ class RichProgressTracker:
         if message and self.verbose:
             self.console.print(f"[green]✓ {message}[/green]")
 
+    def _completed_weight(self) -> float:
+        """Total weight of the stages before the current one."""
+        prefix = self._stage_prefix.get(self.current_stage)
+        if prefix is None:
+            # Past the last weighted stage, everything before it is complete
+            prefix = 0.0 if self.current_stage < 1 else sum(self.STAGE_WEIGHTS.values())
+        return prefix
+
     def get_overall_progress(self) -> float:
         """Calculate overall progress."""
-        completed_weight = sum(self.STAGE_WEIGHTS.get(s, 0) for s in range(1, self.current_stage))
+        completed_weight = self._completed_weight()
         current_weight = self.STAGE_WEIGHTS.get(self.current_stage, 0) * self.stage_progress
         return completed_weight + current_weight
 
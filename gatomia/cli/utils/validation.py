@@ -65,11 +65,10 @@ def validate_api_key(api_key: str, min_length: int = 10) -> str:
     Raises:
         ConfigurationError: If API key is invalid
     """
-    if not api_key or not api_key.strip():
+    api_key = api_key.strip() if api_key else ""
+    if not api_key:
         raise ConfigurationError("API key cannot be empty")
 
-    api_key = api_key.strip()
-
     if len(api_key) < min_length:
         raise ConfigurationError(f"API key too short (minimum {min_length} characters)")
 
@@ -89,10 +88,11 @@ def validate_model_name(model: str) -> str:
     Raises:
         ConfigurationError: If model name is invalid
     """
-    if not model or not model.strip():
+    model = model.strip() if model else ""
+    if not model:
         raise ConfigurationError("Model name cannot be empty")
 
-    return model.strip()
+    return model
 
 
 def validate_output_directory(path: str) -> Path:
@@ -1,8 +1,8 @@
 import logging
 import os
-import traceback
 import asyncio
-from typing import Dict, Any, List
+import random
+from typing import Dict, Any, List, Optional, Tuple
 
 # pydantic_ai
 from pydantic_ai import Agent, ModelSettings
@@ -14,7 +14,12 @@ from gatomia.src.be.agent_tools.str_replace_editor import str_replace_editor_too
 from gatomia.src.be.agent_tools.generate_sub_module_documentations import (
     generate_sub_module_documentation_tool,
 )
-from gatomia.src.be.llm_services import create_fallback_models
+from gatomia.src.be.llm_services import (
+    RETRY_MAX_DELAY,
+    create_fallback_models,
+    is_transient_llm_error,
+    retry_after_seconds,
+)
 from gatomia.src.be.prompt_template import (
     format_user_prompt,
     format_system_prompt,
@@ -27,27 +32,74 @@ from gatomia.src.config import (
     OVERVIEW_FILENAME,
 )
 from gatomia.src.utils import file_manager
+from gatomia.src.be.state_manager import StateManager
 from gatomia.src.be.dependency_analyzer.models.core import Node
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+class TokenBudget:
+    """
+    Limits the number of tokens in flight across concurrent LLM calls.
+
+    Unlike a fixed semaphore, many small prompts can run side by side while a
+    few large ones take the whole budget.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self, tokens: int) -> int:
+        """Wait until `tokens` fit in the budget and reserve them; returns the amount reserved."""
+        # A single oversized request may still run, on its own
+        tokens = min(tokens, self.capacity)
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight + tokens <= self.capacity)
+            self._in_flight += tokens
+        return tokens
+
+    async def release(self, tokens: int):
+        """Return reserved tokens and wake waiting callers."""
+        async with self._condition:
+            self._in_flight -= tokens
+            self._condition.notify_all()
+
+
 class AgentOrchestrator:
     """Orchestrates the AI agents for documentation generation."""
 
     def __init__(self, config: Config):
         self.config = config
-        self._semaphore = asyncio.Semaphore(5)  # Limit concurrent LLM calls
+        # Worst case matches `llm_concurrency` full-size calls; smaller prompts pack tighter
+        self._token_budget = TokenBudget(
+            config.llm_concurrency * (config.max_token_per_module + config.max_tokens)
+        )
         self.fallback_models = create_fallback_models(config)
+        self._abs_repo_path = os.path.abspath(config.repo_path)
+        # working_dir -> (module tree path, overview docs path)
+        self._working_dir_paths: Dict[str, Tuple[str, str]] = {}
+        # The components dict is shared for the whole run, so its identity is a stable key
+        self._complex_cache: Dict[tuple, bool] = {}
         self.custom_instructions = config.get_prompt_addition() if config else None
+        self._prompt_cache: Dict[Tuple[str, bool], str] = {}
+        self._git_metadata: Optional[Tuple[str, str]] = None
 
     def create_agent(
         self, module_name: str, components: Dict[str, Any], core_component_ids: List[str]
     ) -> Agent:
         """Create an appropriate agent based on module complexity."""
 
-        if is_complex_module(components, core_component_ids):
+        key = (id(components), tuple(core_component_ids))
+        is_complex = self._complex_cache.get(key)
+        if is_complex is None:
+            is_complex = self._complex_cache[key] = is_complex_module(
+                components, core_component_ids
+            )
+
+        if is_complex:
             return Agent(
                 self.fallback_models,
                 name=module_name,
@@ -57,12 +109,7 @@ class AgentOrchestrator:
                     str_replace_editor_tool,
                     generate_sub_module_documentation_tool,
                 ],
-                system_prompt=format_system_prompt(
-                    module_name=module_name,
-                    author_name=get_git_author(),
-                    version=get_git_version(),
-                    custom_instructions=self.custom_instructions,
-                ),
+                system_prompt=self._get_system_prompt(module_name, is_complex=True),
             )
         else:
             return Agent(
@@ -70,13 +117,37 @@ class AgentOrchestrator:
                 name=module_name,
                 deps_type=GatomIADeps,
                 tools=[read_code_components_tool, str_replace_editor_tool],
-                system_prompt=format_leaf_system_prompt(
-                    module_name=module_name,
-                    author_name=get_git_author(),
-                    version=get_git_version(),
-                    custom_instructions=self.custom_instructions,
-                ),
+                system_prompt=self._get_system_prompt(module_name, is_complex=False),
+            )
+
+    def _get_system_prompt(self, module_name: str, is_complex: bool) -> str:
+        """Get the formatted system prompt for a module, formatting it once per run."""
+        key = (module_name, is_complex)
+        prompt = self._prompt_cache.get(key)
+        if prompt is None:
+            # Git author/version are constant for the run; each lookup spawns git
+            if self._git_metadata is None:
+                self._git_metadata = (get_git_author(), get_git_version())
+            author_name, version = self._git_metadata
+
+            format_prompt = format_system_prompt if is_complex else format_leaf_system_prompt
+            prompt = self._prompt_cache[key] = format_prompt(
+                module_name=module_name,
+                author_name=author_name,
+                version=version,
+                custom_instructions=self.custom_instructions,
             )
+        return prompt
+
+    def _get_working_dir_paths(self, working_dir: str) -> Tuple[str, str]:
+        """Get the module tree and overview paths for a working directory, joined once."""
+        paths = self._working_dir_paths.get(working_dir)
+        if paths is None:
+            paths = self._working_dir_paths[working_dir] = (
+                os.path.join(working_dir, MODULE_TREE_FILENAME),
+                os.path.join(working_dir, OVERVIEW_FILENAME),
+            )
+        return paths
 
     async def process_module(
         self,
@@ -86,13 +157,33 @@ class AgentOrchestrator:
         module_path: List[str],
         working_dir: str,
         progress_callback: Any = None,
+        module_tree: Optional[Dict[str, Any]] = None,
+        state_manager: Optional[StateManager] = None,
     ) -> Dict[str, Any]:
-        """Process a single module and generate its documentation."""
-        logger.info(f"Processing module: {module_name}")
+        """
+        Process a single module and generate its documentation.
+
+        When modules are processed concurrently, callers pass a shared `module_tree`
+        and `state_manager` so sub-module updates from each agent are not lost.
+        """
+        logger.info("Processing module: %s", module_name)
+
+        module_tree_path, overview_docs_path = self._get_working_dir_paths(working_dir)
 
         # Load or create module tree
-        module_tree_path = os.path.join(working_dir, MODULE_TREE_FILENAME)
-        module_tree = file_manager.load_json(module_tree_path)
+        if module_tree is None:
+            module_tree = file_manager.load_json(module_tree_path)
+
+        # check if overview docs already exists, before paying for agent construction
+        if os.path.exists(overview_docs_path):
+            logger.info("✓ Overview docs already exists at %s", overview_docs_path)
+            return module_tree
+
+        # check if module docs already exists
+        docs_path = os.path.join(working_dir, f"{module_name}.md")
+        if os.path.exists(docs_path):
+            logger.info("✓ Module docs already exists at %s", docs_path)
+            return module_tree
 
         # Create agent
         agent = self.create_agent(module_name, components, core_component_ids)
@@ -100,7 +191,7 @@ class AgentOrchestrator:
         # Create dependencies
         deps = GatomIADeps(
             absolute_docs_path=working_dir,
-            absolute_repo_path=str(os.path.abspath(self.config.repo_path)),
+            absolute_repo_path=self._abs_repo_path,
             registry={},
             components=components,
             path_to_current_module=module_path,
@@ -111,55 +202,64 @@ class AgentOrchestrator:
             config=self.config,
             custom_instructions=self.custom_instructions,
             progress_callback=progress_callback,
+            state_manager=state_manager,
         )
 
-        # check if overview docs already exists
-        overview_docs_path = os.path.join(working_dir, OVERVIEW_FILENAME)
-        if os.path.exists(overview_docs_path):
-            logger.info(f"✓ Overview docs already exists at {overview_docs_path}")
-            return module_tree
-
-        # check if module docs already exists
-        docs_path = os.path.join(working_dir, f"{module_name}.md")
-        if os.path.exists(docs_path):
-            logger.info(f"✓ Module docs already exists at {docs_path}")
-            return module_tree
-
         # Run agent
         max_retries = 3
         retry_delay = 2
 
         for attempt in range(max_retries):
             try:
-                async with self._semaphore:
+                user_prompt = format_user_prompt(
+                    module_name=module_name,
+                    core_component_ids=core_component_ids,
+                    components=components,
+                    module_tree=deps.module_tree,
+                    max_tokens=self.config.max_token_per_module,
+                )
+                # Rough estimate (~4 chars per token) plus room for the response
+                reserved = await self._token_budget.acquire(
+                    len(user_prompt) // 4 + self.config.max_tokens
+                )
+                try:
                     await agent.run(
-                        format_user_prompt(
-                            module_name=module_name,
-                            core_component_ids=core_component_ids,
-                            components=components,
-                            module_tree=deps.module_tree,
-                            max_tokens=self.config.max_token_per_module,
-                        ),
+                        user_prompt,
                         deps=deps,
                         model_settings=ModelSettings(max_tokens=self.config.max_tokens),
                     )
+                finally:
+                    await self._token_budget.release(reserved)
 
                 # Save updated module tree
                 file_manager.save_json(deps.module_tree, module_tree_path)
-                logger.debug(f"Successfully processed module: {module_name}")
+                logger.debug("Successfully processed module: %s", module_name)
 
                 return deps.module_tree
 
             except Exception as e:
                 logger.warning(
-                    f"Error processing module {module_name} (attempt {attempt + 1}/{max_retries}): {str(e)}"
+                    "Error processing module %s (attempt %d/%d): %s",
+                    module_name,
+                    attempt + 1,
+                    max_retries,
+                    e,
                 )
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(retry_delay)
+                if attempt < max_retries - 1 and is_transient_llm_error(e):
+                    # Jitter keeps concurrent modules from retrying in lockstep; the cap
+                    # also bounds a provider's Retry-After
+                    delay = min(
+                        RETRY_MAX_DELAY,
+                        retry_after_seconds(e) or retry_delay * (0.5 + random.random()),
+                    )
+                    await asyncio.sleep(delay)
                     retry_delay *= 2  # Exponential backoff
                 else:
+                    # exc_info leaves traceback formatting to the handler, if it emits at all
                     logger.error(
-                        f"Failed to process module {module_name} after {max_retries} attempts"
+                        "Failed to process module %s after %d attempts",
+                        module_name,
+                        attempt + 1,
+                        exc_info=True,
                     )
-                    logger.error(f"Traceback: {traceback.format_exc()}")
                     raise
@@ -1,9 +1,10 @@
 from dataclasses import dataclass
+from typing import Any
 from gatomia.src.be.dependency_analyzer.models.core import Node
 from gatomia.src.config import Config
 
 
-@dataclass
+@dataclass(slots=True)
 class GatomIADeps:
     absolute_docs_path: str
     absolute_repo_path: str
@@ -17,3 +18,4 @@ class GatomIADeps:
     config: Config  # LLM configuration
     custom_instructions: str = None
     progress_callback: callable = None  # Optional callback for progress updates
+    state_manager: Any = None  # Shared StateManager so concurrent modules don't clobber state
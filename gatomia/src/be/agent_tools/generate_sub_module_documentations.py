@@ -51,13 +51,14 @@ async def generate_sub_module_documentation(
         indent = "  " * deps.current_depth
         arrow = "└─" if deps.current_depth > 0 else "→"
 
-        test_msg = f"{indent}{arrow} Generating documentation for sub-module: {sub_module_name}"
-        logger.info(test_msg)
+        logger.info(
+            "%s%s Generating documentation for sub-module: %s", indent, arrow, sub_module_name
+        )
         if deps.progress_callback:
             deps.progress_callback(f"Generating sub-module: {sub_module_name}")
 
         # --- CACHING LOGIC ---
-        state_manager = StateManager(deps.absolute_docs_path)
+        state_manager = deps.state_manager or StateManager(deps.absolute_docs_path)
         full_sub_module_path = "/".join(deps.path_to_current_module + [sub_module_name])
         current_hash = calculate_module_hash(core_component_ids, ctx.deps.components)
 
@@ -65,7 +66,7 @@ async def generate_sub_module_documentation(
         if state_manager.is_module_up_to_date(
             full_sub_module_path, current_hash
         ) and os.path.exists(md_path):
-            logger.info(f"{indent}  ⏭️  Skipping up-to-date sub-module: {sub_module_name}")
+            logger.info("%s  ⏭️  Skipping up-to-date sub-module: %s", indent, sub_module_name)
             if deps.progress_callback:
                 deps.progress_callback(f"Skipping cached sub-module: {sub_module_name}")
             continue
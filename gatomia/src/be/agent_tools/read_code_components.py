@@ -9,17 +9,19 @@ async def read_code_components(ctx: RunContext[GatomIADeps], component_ids: list
         component_ids: The ids of the components to read, e.g. ["sweagent.types.AgentRunResult", "sweagent.types.AgentRunResult"] where sweagent.types part is the path to the component and AgentRunResult is the name of the component
     """
 
-    results = []
-
-    for component_id in component_ids:
-        if component_id not in ctx.deps.components:
-            results.append(f"# Component {component_id} not found")
-        else:
-            results.append(
-                f"# Component {component_id}:\n{ctx.deps.components[component_id].source_code.strip()}\n\n"
-            )
-
-    return "\n".join(results)
+    components = ctx.deps.components
+
+    # Build each distinct component once; the model often repeats ids
+    parts = {}
+    for component_id in dict.fromkeys(component_ids):
+        node = components.get(component_id)
+        parts[component_id] = (
+            "# Component " + component_id + " not found"
+            if node is None
+            else "# Component " + component_id + ":\n" + node.stripped_source_code + "\n\n"
+        )
+
+    return "\n".join(parts[component_id] for component_id in component_ids)
 
 
 read_code_components_tool = Tool(
@@ -6,7 +6,7 @@ import traceback
 logger = logging.getLogger(__name__)
 
 from gatomia.src.be.dependency_analyzer.models.core import Node
-from gatomia.src.be.llm_services import call_llm
+from gatomia.src.be.llm_services import call_llm_with_retry
 from gatomia.src.be.utils import count_tokens
 from gatomia.src.config import Config
 from gatomia.src.be.prompt_template import format_cluster_prompt
@@ -70,7 +70,9 @@ async def cluster_modules(
         potential_core_components, current_module_tree, current_module_name
     )
     # Structuring/Clustering doesn't need reasoning and is much faster without it
-    response = await call_llm(prompt, config, model=config.cluster_model, include_reasoning=False)
+    response = await call_llm_with_retry(
+        prompt, config, model=config.cluster_model, include_reasoning=False
+    )
 
     # parse the response
     try:
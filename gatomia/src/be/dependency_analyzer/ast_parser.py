@@ -172,19 +172,33 @@ class DependencyParser:
         return path.replace(os.path.sep, ".")
 
     def save_dependency_graph(self, output_path: str):
-        result = {}
-        for component_id, component in self.components.items():
-            component_dict = component.model_dump()
-            if "depends_on" in component_dict and isinstance(component_dict["depends_on"], set):
-                component_dict["depends_on"] = list(component_dict["depends_on"])
-            result[component_id] = component_dict
-
-        dir_name = os.path.dirname(output_path)
-        if dir_name:
-            os.makedirs(dir_name, exist_ok=True)
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
-
-        logger.debug(f"Saved {len(self.components)} components to {output_path}")
-        return result
+        return save_dependency_graph(self.components, output_path)
+
+
+def save_dependency_graph(components: Dict[str, Node], output_path: str) -> Dict[str, Any]:
+    """
+    Write components to output_path as the dependency graph JSON.
+
+    Args:
+        components: Mapping of component ID -> Node
+        output_path: Path of the JSON file to write
+
+    Returns:
+        The serialized graph
+    """
+    result = {}
+    for component_id, component in components.items():
+        component_dict = component.model_dump()
+        if "depends_on" in component_dict and isinstance(component_dict["depends_on"], set):
+            component_dict["depends_on"] = list(component_dict["depends_on"])
+        result[component_id] = component_dict
+
+    dir_name = os.path.dirname(output_path)
+    if dir_name:
+        os.makedirs(dir_name, exist_ok=True)
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+
+    logger.debug(f"Saved {len(components)} components to {output_path}")
+    return result
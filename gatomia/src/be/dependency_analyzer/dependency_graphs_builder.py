@@ -1,7 +1,7 @@
 from typing import Dict, List, Any
 import os
 from gatomia.src.config import Config
-from gatomia.src.be.dependency_analyzer.ast_parser import DependencyParser
+from gatomia.src.be.dependency_analyzer.ast_parser import DependencyParser, save_dependency_graph
 from gatomia.src.be.dependency_analyzer.topo_sort import build_graph_from_components, get_leaf_nodes
 from gatomia.src.utils import file_manager
 
@@ -16,6 +16,23 @@ class DependencyGraphBuilder:
     def __init__(self, config: Config):
         self.config = config
 
+    def _dependency_graph_path(self) -> str:
+        """Path of the saved dependency graph JSON for the configured repository."""
+        repo_name = os.path.basename(os.path.normpath(self.config.repo_path))
+        sanitized_repo_name = "".join(c if c.isalnum() else "_" for c in repo_name)
+        return os.path.join(
+            self.config.dependency_graph_dir, f"{sanitized_repo_name}_dependency_graph.json"
+        )
+
+    def save_dependency_graph(self, components: Dict[str, Any]) -> None:
+        """
+        Save already-parsed components as the dependency graph JSON.
+
+        Writes the same file build_dependency_graph does, for callers that reuse a
+        previously parsed graph.
+        """
+        save_dependency_graph(components, self._dependency_graph_path())
+
     def build_dependency_graph(self) -> tuple[Dict[str, Any], List[str]]:
         """
         Build and save dependency graph, returning components and leaf nodes.
@@ -29,9 +46,7 @@ class DependencyGraphBuilder:
         # Prepare dependency graph path
         repo_name = os.path.basename(os.path.normpath(self.config.repo_path))
         sanitized_repo_name = "".join(c if c.isalnum() else "_" for c in repo_name)
-        dependency_graph_path = os.path.join(
-            self.config.dependency_graph_dir, f"{sanitized_repo_name}_dependency_graph.json"
-        )
+        dependency_graph_path = self._dependency_graph_path()
         filtered_folders_path = os.path.join(
             self.config.dependency_graph_dir, f"{sanitized_repo_name}_filtered_folders.json"
         )
@@ -1,6 +1,7 @@
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any, Set
 from datetime import datetime
+from functools import cached_property
 
 
 
@@ -42,6 +43,11 @@ class Node(BaseModel):
     def get_display_name(self) -> str:
         return self.display_name or self.name
 
+    @cached_property
+    def stripped_source_code(self) -> str:
+        # Agents re-read the same components many times; strip once per node
+        return (self.source_code or "").strip()
+
 
 class CallRelationship(BaseModel):
     caller: str
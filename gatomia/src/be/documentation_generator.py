@@ -1,16 +1,22 @@
+import asyncio
+import io
 import logging
 import os
 import json
-from typing import Dict, List, Any, Callable, Optional
-from copy import deepcopy
-import traceback
+import re
+from itertools import islice
+from typing import Dict, List, Any, Callable, Optional, Set, Tuple
 
 # Configure logging and monitoring
 logger = logging.getLogger(__name__)
 
 # Local imports
 from gatomia.src.be.dependency_analyzer import DependencyGraphBuilder
-from gatomia.src.be.llm_services import call_llm
+from gatomia.src.be.llm_services import (
+    call_llm_with_retry,
+    clear_llm_cache,
+    get_llm_cache_stats,
+)
 from gatomia.src.be.prompt_template import (
     format_repo_overview_prompt,
     format_module_overview_prompt,
@@ -25,10 +31,31 @@ from gatomia.src.config import (
 from gatomia.src.utils import file_manager
 from gatomia.src.be.agent_orchestrator import AgentOrchestrator
 from gatomia.src.be.state_manager import StateManager
-from gatomia.src.be.hashing import calculate_module_hash
+from gatomia.src.be.hashing import (
+    calculate_module_hash,
+    clear_file_hash_cache,
+    export_file_hash_index,
+    load_file_hash_index,
+)
 from gatomia.src.be.utils import get_git_author, get_git_version
 import shutil
 
+# Parent/overview docs are returned wrapped in <OVERVIEW> tags
+OVERVIEW_PATTERN = re.compile(r"<OVERVIEW>(.*?)</OVERVIEW>", re.DOTALL)
+
+# Headers that signal the start of detailed content we want to skip for parent summary
+SUMMARY_STOP_HEADERS = (
+    "## core components",
+    "## sub-modules",
+    "## sub modules",
+    "## detailed design",
+    "## implementation",
+    "## classes",
+    "## functions",
+    "## api",
+)
+SUMMARY_SKIPPED_PREFIXES = ("**referenced files:**", "<cite>")
+
 
 class DocumentationGenerator:
     """Main documentation generation orchestrator."""
@@ -38,6 +65,33 @@ class DocumentationGenerator:
         self.commit_id = commit_id
         self.graph_builder = DependencyGraphBuilder(config)
         self.agent_orchestrator = AgentOrchestrator(config)
+        # Child doc summaries keyed by path, as (mtime_ns, summary); a parent and the
+        # repo overview read the same children, so each file is summarized once.
+        self._docs_cache: Dict[str, tuple[int, str]] = {}
+        # Parsed JSON files keyed by path, as (mtime_ns, data); see _cached_load_json
+        self._json_cache: Dict[str, Tuple[int, Any]] = {}
+        # Markdown files known to exist per docs directory, listed once per generation
+        # run and kept current as parent docs are written; see _doc_exists
+        self._present_docs: Dict[str, Set[str]] = {}
+
+    def _cached_load_json(self, path: str) -> Optional[Any]:
+        """
+        Load a JSON file, reusing the previous parse while its mtime is unchanged.
+
+        The returned object is shared between callers and must not be modified.
+        """
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        cached = self._json_cache.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        data = file_manager.load_json(path)
+        self._json_cache[path] = (mtime_ns, data)
+        return data
 
     def create_documentation_metadata(
         self, working_dir: str, components: Dict[str, Any], num_leaf_nodes: int
@@ -63,41 +117,58 @@ class DocumentationGenerator:
 
         # Add generated markdown files to the metadata
         try:
-            for file_path in os.listdir(working_dir):
-                if file_path.endswith(".md") and file_path not in metadata["files_generated"]:
-                    metadata["files_generated"].append(file_path)
+            listed = set(metadata["files_generated"])
+            metadata["files_generated"] += sorted(self._list_md_files(working_dir) - listed)
         except Exception as e:
-            logger.warning(f"Could not list generated files: {e}")
+            logger.warning("Could not list generated files: %s", e)
 
         metadata_path = os.path.join(working_dir, "metadata.json")
         file_manager.save_json(metadata, metadata_path)
 
     def get_processing_order(
-        self, module_tree: Dict[str, Any], parent_path: List[str] = []
+        self, module_tree: Dict[str, Any], parent_path: Tuple[str, ...] = ()
     ) -> List[tuple[List[str], str]]:
         """Get the processing order using topological sort (leaf modules first)."""
         processing_order = []
 
-        def collect_modules(tree: Dict[str, Any], path: List[str]):
-            for module_name, module_info in tree.items():
-                current_path = path + [module_name]
-
-                # If this module has children, process them first
-                if (
-                    module_info.get("children")
-                    and isinstance(module_info["children"], dict)
-                    and module_info["children"]
-                ):
-                    collect_modules(module_info["children"], current_path)
-                    # Add this parent module after its children
-                    processing_order.append((current_path, module_name))
-                else:
-                    # This is a leaf module, add it immediately
-                    processing_order.append((current_path, module_name))
-
-        collect_modules(module_tree, parent_path)
+        # Iterative post-order walk: each stack frame is (children iterator, path, name),
+        # and a parent is emitted once its children iterator is exhausted.
+        stack = [(iter(module_tree.items()), tuple(parent_path), None)]
+        while stack:
+            items, path, parent_name = stack[-1]
+            entry = next(items, None)
+            if entry is None:
+                stack.pop()
+                if parent_name is not None:
+                    processing_order.append((list(path), parent_name))
+                continue
+
+            module_name, module_info = entry
+            current_path = path + (module_name,)
+            children = module_info.get("children")
+            if children and isinstance(children, dict):
+                # Process its children first
+                stack.append((iter(children.items()), current_path, module_name))
+            else:
+                # This is a leaf module, add it immediately
+                processing_order.append((list(current_path), module_name))
+
         return processing_order
 
+    def _index_module_tree(self, module_tree: Dict[str, Any]) -> Dict[tuple, Dict[str, Any]]:
+        """Map every module path (as a tuple) to its node in a single walk of the tree."""
+        node_index = {}
+        stack = [(module_tree, ())]
+        while stack:
+            tree, path = stack.pop()
+            for module_name, module_info in tree.items():
+                current_path = path + (module_name,)
+                node_index[current_path] = module_info
+                children = module_info.get("children")
+                if children and isinstance(children, dict):
+                    stack.append((children, current_path))
+        return node_index
+
     def is_leaf_module(self, module_info: Dict[str, Any]) -> bool:
         """Check if a module is a leaf module (has no children or empty children)."""
         children = module_info.get("children", {})
@@ -109,33 +180,21 @@ class DocumentationGenerator:
         Strategy: Extract content until we hit details sections like 'Core Components' or 'Sub-modules'.
         """
         try:
-            lines = markdown_content.splitlines()
             summary_lines = []
 
-            # Headers that signal the start of detailed content we want to skip for parent summary
-            stop_headers = [
-                "## core components",
-                "## sub-modules",
-                "## sub modules",
-                "## detailed design",
-                "## implementation",
-                "## classes",
-                "## functions",
-                "## api",
-            ]
-
-            for line in lines:
-                stripped = line.strip().lower()
+            # Lines are read lazily: only the first ~80 are ever needed
+            for line in io.StringIO(markdown_content, newline=None):
+                line = line.rstrip("\n")
+                # Every prefix we look for is short, so only lowercase the start of the line
+                prefix = line.lstrip()[:32].lower()
 
                 # Check if we hit a stop header
-                if any(stripped.startswith(header) for header in stop_headers):
+                if prefix.startswith(SUMMARY_STOP_HEADERS):
                     break
 
-                # Check for "Files:" or "Referenced Files" lists which are often huge
-                if stripped.startswith("**referenced files:**") or stripped.startswith("<cite>"):
-                    continue  # Skip citation block in summary if it's too early, actually we might want to keep it?
-                    # Prompt template puts it at top. Let's keep it for now but maybe later.
-                    pass
+                # Skip "Referenced Files" lists and citation blocks, which are often huge
+                if prefix.startswith(SUMMARY_SKIPPED_PREFIXES):
+                    continue
 
                 summary_lines.append(line)
 
@@ -146,38 +205,90 @@ class DocumentationGenerator:
 
             # If logic failed to grab ample content (e.g. empty), fallback to first 50 lines
             if len(summary_lines) < 3:
-                return "\n".join(lines[:50])
+                head = islice(io.StringIO(markdown_content, newline=None), 50)
+                return "\n".join(line.rstrip("\n") for line in head)
 
             return "\n".join(summary_lines)
 
         except Exception:
             return markdown_content[:2000]  # Fallback to crude truncation
 
+    def _scan_md_files(self, working_dir: str) -> Dict[str, os.DirEntry]:
+        """Map the markdown file names in working_dir to their entries, in one directory read."""
+        with os.scandir(working_dir) as entries:
+            return {entry.name: entry for entry in entries if entry.name.endswith(".md")}
+
+    def _list_md_files(self, working_dir: str) -> Set[str]:
+        """List the markdown files in working_dir with a single directory read."""
+        return set(self._scan_md_files(working_dir))
+
+    def _doc_exists(self, working_dir: str, filename: str) -> bool:
+        """Check whether a doc exists, without a stat when the directory is tracked."""
+        present = self._present_docs.get(working_dir)
+        if present is None:
+            return os.path.exists(os.path.join(working_dir, filename))
+        return filename in present
+
+    def _load_module_summary(
+        self, doc_path: str, entry: Optional[os.DirEntry] = None
+    ) -> Optional[str]:
+        """
+        Return the summary of a module doc, or None if it does not exist.
+
+        A DirEntry from a directory scan supplies the mtime without a separate
+        stat on platforms where scandir already returns it (e.g. Windows).
+        """
+        try:
+            mtime_ns = (entry.stat() if entry is not None else os.stat(doc_path)).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        cached = self._docs_cache.get(doc_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        # Optimization: Extract only the summary instead of full content
+        summary = self._extract_module_summary(file_manager.load_text(doc_path))
+        self._docs_cache[doc_path] = (mtime_ns, summary)
+        return summary
+
     def build_overview_structure(
         self, module_tree: Dict[str, Any], module_path: List[str], working_dir: str
     ) -> Dict[str, Any]:
         """Build structure for overview generation with 1-depth children docs and target indicator."""
 
-        processed_module_tree = deepcopy(module_tree)
+        # Copy only the spine down to the target (and the target's children, which
+        # receive docs); every other subtree is shared read-only with module_tree.
+        processed_module_tree = dict(module_tree)
         module_info = processed_module_tree
-        for path_part in module_path:
-            module_info = module_info[path_part]
-            if path_part != module_path[-1]:
-                module_info = module_info.get("children", {})
+        last_index = len(module_path) - 1
+        for index, path_part in enumerate(module_path):
+            node = dict(module_info[path_part])
+            module_info[path_part] = node
+            if index < last_index:
+                node["children"] = dict(node.get("children", {}))
+                module_info = node["children"]
             else:
-                module_info["is_target_for_overview_generation"] = True
+                node["is_target_for_overview_generation"] = True
+                module_info = node
 
-        if "children" in module_info:
+        if module_path and "children" in module_info:
+            module_info["children"] = dict(module_info["children"])
             module_info = module_info["children"]
 
+        # One directory read instead of an existence check per child
+        md_files = self._scan_md_files(working_dir) if module_info else {}
         for child_name, child_info in module_info.items():
+            child_info = module_info[child_name] = dict(child_info)
             child_path = os.path.join(working_dir, f"{child_name}.md")
-            if os.path.exists(child_path):
-                # Optimization: Extract only the summary instead of full content
-                full_content = file_manager.load_text(child_path)
-                child_info["docs"] = self._extract_module_summary(full_content)
+            summary = None
+            entry = md_files.get(f"{child_name}.md")
+            if entry is not None:
+                summary = self._load_module_summary(child_path, entry)
+            if summary is not None:
+                child_info["docs"] = summary
             else:
-                logger.warning(f"Module docs not found at {child_path}")
+                logger.warning("Module docs not found at %s", child_path)
                 child_info["docs"] = ""
 
         return processed_module_tree
@@ -189,21 +300,28 @@ class DocumentationGenerator:
         force: bool = False,
         resume: bool = False,
         progress_callback: Optional[Callable[[int, int, str, bool], None]] = None,
+        state_manager: Optional[StateManager] = None,
     ) -> str:
         """Generate documentation for all modules using dynamic programming approach."""
         # Prepare output directory
         working_dir = os.path.abspath(self.config.docs_dir)
         file_manager.ensure_directory(working_dir)
 
-        # Initialize StateManager
-        state_manager = StateManager(working_dir)
+        # Share the caller's StateManager, so its later writes don't clobber ours
+        if state_manager is None:
+            state_manager = StateManager(working_dir)
         if force:
             state_manager.clear_state()
 
+        self._present_docs[working_dir] = self._list_md_files(working_dir)
+        # Files whose mtime and size match the last run are not read again for hashing
+        load_file_hash_index(state_manager.get_file_hashes())
+
         module_tree_path = os.path.join(working_dir, MODULE_TREE_FILENAME)
         first_module_tree_path = os.path.join(working_dir, FIRST_MODULE_TREE_FILENAME)
+        # Agents add sub-modules to module_tree, so it needs a private copy
         module_tree = file_manager.load_json(module_tree_path)
-        first_module_tree = file_manager.load_json(first_module_tree_path)
+        first_module_tree = self._cached_load_json(first_module_tree_path)
 
         # Get processing order (leaf modules first)
         processing_order = self.get_processing_order(first_module_tree)
@@ -214,57 +332,68 @@ class DocumentationGenerator:
 
         if len(module_tree) > 0:
             total_modules = len(processing_order)
+            # Agents add sub-modules to nodes in place, so these references stay valid
+            node_index = self._index_module_tree(module_tree)
             current_count = 0
-
-            for module_path, module_name in processing_order:
+            # Modules are documented concurrently; a parent only waits for its own
+            # children, not for every module at the level below it.
+            semaphore = asyncio.Semaphore(self.config.llm_concurrency)
+            # Parents cover all of their children's files; hash each file once per run
+            file_hashes: Dict[str, str] = {}
+
+            async def process_entry(module_path: List[str], module_name: str) -> None:
+                nonlocal current_count
                 current_count += 1
+                count = current_count
+                module_key = "/".join(module_path)
                 try:
                     # Get the module info from the tree
-                    module_info = module_tree
-                    for path_part in module_path:
-                        module_info = module_info[path_part]
-                        if path_part != module_path[-1]:  # Not the last part
-                            module_info = module_info.get("children", {})
+                    module_info = node_index[tuple(module_path)]
 
                     # Skip if already processed in this run
-                    module_key = "/".join(module_path)
                     if module_key in processed_modules:
-                        continue
+                        return
 
                     # Check if up-to-date (Incremental Update)
-                    current_hash = calculate_module_hash(module_info["components"], components)
+                    current_hash = calculate_module_hash(
+                        module_info["components"], components, file_hashes
+                    )
                     if not force and state_manager.is_module_up_to_date(module_key, current_hash):
-                        logger.info(f"⏭️  Skipping up-to-date module: {module_key}")
+                        # Incremental runs skip most modules; only format when it is shown
+                        if logger.isEnabledFor(logging.INFO):
+                            logger.info("⏭️  Skipping up-to-date module: %s", module_key)
                         if progress_callback:
-                            progress_callback(current_count, total_modules, module_name, True)
-                        continue
+                            progress_callback(count, total_modules, module_name, True)
+                        return
 
                     # Update status before processing
                     if progress_callback:
-                        progress_callback(current_count, total_modules, module_name, False)
+                        progress_callback(count, total_modules, module_name, False)
 
                     # Define progress wrapper for sub-modules
                     progress_wrapper = None
                     if progress_callback:
                         progress_wrapper = lambda msg: progress_callback(
-                            current_count, total_modules, f"{module_name} › {msg}", False
+                            count, total_modules, f"{module_name} › {msg}", False
                         )
 
                     # Process the module
                     if self.is_leaf_module(module_info):
-                        logger.info(f"📄 Processing leaf module: {module_key}")
-                        final_module_tree = await self.agent_orchestrator.process_module(
+                        logger.info("📄 Processing leaf module: %s", module_key)
+                        await self.agent_orchestrator.process_module(
                             module_name,
                             components,
                             module_info["components"],
                             module_path,
                             working_dir,
                             progress_callback=progress_wrapper,
+                            module_tree=module_tree,
+                            state_manager=state_manager,
                         )
                     else:
-                        logger.info(f"📁 Processing parent module: {module_key}")
-                        final_module_tree = await self.generate_parent_module_docs(
-                            module_path, working_dir
+                        logger.info("📁 Processing parent module: %s", module_key)
+                        await self.generate_parent_module_docs(
+                            module_path, working_dir, module_tree=module_tree
                         )
 
                     processed_modules.add(module_key)
@@ -272,15 +401,43 @@ class DocumentationGenerator:
                     state_manager.update_module_state(module_key, current_hash)
 
                 except Exception as e:
-                    logger.error(f"Failed to process module {module_key}: {str(e)}")
-                    logger.error(f"Traceback: {traceback.format_exc()}")
-                    continue
+                    logger.error("Failed to process module %s: %s", module_key, e, exc_info=True)
+
+            async def process_after(
+                module_path: List[str], module_name: str, dependencies: List[asyncio.Task]
+            ) -> None:
+                if dependencies:
+                    await asyncio.gather(*dependencies)
+                async with semaphore:
+                    await process_entry(module_path, module_name)
+
+            # Post-order guarantees every child's task exists before its parent's
+            tasks: Dict[tuple, asyncio.Task] = {}
+            for module_path, module_name in processing_order:
+                path_key = tuple(module_path)
+                node = node_index.get(path_key)
+                children = node.get("children") if node is not None else None
+                dependencies = []
+                if children and isinstance(children, dict):
+                    dependencies = [
+                        tasks[path_key + (child_name,)]
+                        for child_name in children
+                        if path_key + (child_name,) in tasks
+                    ]
+                tasks[path_key] = asyncio.create_task(
+                    process_after(module_path, module_name, dependencies)
+                )
+            # One state write every few seconds instead of one per module
+            with state_manager.batch():
+                await asyncio.gather(*tasks.values())
 
             # Generate repo overview
-            logger.info(f"📚 Generating repository overview")
-            final_module_tree = await self.generate_parent_module_docs([], working_dir)
+            logger.info("📚 Generating repository overview")
+            final_module_tree = await self.generate_parent_module_docs(
+                [], working_dir, module_tree=module_tree
+            )
         else:
-            logger.info(f"Processing whole repo because repo can fit in the context window")
+            logger.info("Processing whole repo because repo can fit in the context window")
             repo_name = os.path.basename(os.path.normpath(self.config.repo_path))
 
             progress_wrapper = None
@@ -296,6 +453,7 @@ class DocumentationGenerator:
                 [],
                 working_dir,
                 progress_callback=progress_wrapper,
+                state_manager=state_manager,
             )
             # For whole repo processing, we can treat it as the root module
             root_hash = calculate_module_hash(leaf_nodes, components)
@@ -316,43 +474,55 @@ class DocumentationGenerator:
             readme_path = os.path.join(working_dir, "README.md")
             if os.path.exists(overview_path):
                 shutil.copy(overview_path, readme_path)
-                logger.info(f"Generated README.md from {OVERVIEW_FILENAME}")
+                logger.info("Generated README.md from %s", OVERVIEW_FILENAME)
 
+        state_manager.set_file_hashes(export_file_hash_index())
         return working_dir
 
     async def generate_parent_module_docs(
-        self, module_path: List[str], working_dir: str
+        self,
+        module_path: List[str],
+        working_dir: str,
+        module_tree: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
-        """Generate documentation for a parent module based on its children's documentation."""
+        """
+        Generate documentation for a parent module based on its children's documentation.
+
+        Callers that already hold the in-memory module tree pass it as `module_tree`;
+        otherwise it is loaded from module_tree.json.
+        """
         module_name = (
             module_path[-1]
             if len(module_path) >= 1
             else os.path.basename(os.path.normpath(self.config.repo_path))
         )
 
-        logger.info(f"Generating parent documentation for: {module_name}")
+        logger.info("Generating parent documentation for: %s", module_name)
 
         # Load module tree
-        module_tree_path = os.path.join(working_dir, MODULE_TREE_FILENAME)
-        module_tree = file_manager.load_json(module_tree_path)
+        if module_tree is None:
+            module_tree_path = os.path.join(working_dir, MODULE_TREE_FILENAME)
+            module_tree = self._cached_load_json(module_tree_path)
 
         # check if overview docs already exists
         overview_docs_path = os.path.join(working_dir, OVERVIEW_FILENAME)
-        if os.path.exists(overview_docs_path):
-            logger.info(f"✓ Overview docs already exists at {overview_docs_path}")
+        if self._doc_exists(working_dir, OVERVIEW_FILENAME):
+            logger.info("✓ Overview docs already exists at %s", overview_docs_path)
             return module_tree
 
         # check if parent docs already exists
-        parent_docs_path = os.path.join(
-            working_dir,
-            f"{module_name if len(module_path) >= 1 else OVERVIEW_FILENAME.replace('.md', '')}.md",
+        parent_docs_filename = (
+            f"{module_name if len(module_path) >= 1 else OVERVIEW_FILENAME.replace('.md', '')}.md"
         )
-        if os.path.exists(parent_docs_path):
-            logger.info(f"✓ Parent docs already exists at {parent_docs_path}")
+        parent_docs_path = os.path.join(working_dir, parent_docs_filename)
+        if self._doc_exists(working_dir, parent_docs_filename):
+            logger.info("✓ Parent docs already exists at %s", parent_docs_path)
             return module_tree
 
         # Create repo structure with 1-depth children docs and target indicator
         repo_structure = self.build_overview_structure(module_tree, module_path, working_dir)
+        # Two-space indent: same structure for the LLM, noticeably fewer prompt tokens
+        repo_structure_json = json.dumps(repo_structure, indent=2, ensure_ascii=False)
 
         # Metadata
         author_name = get_git_author()
@@ -361,39 +531,42 @@ class DocumentationGenerator:
         if len(module_path) >= 1:
             prompt = format_module_overview_prompt(
                 module_name=module_name,
-                repo_structure=json.dumps(repo_structure, indent=4),
+                repo_structure=repo_structure_json,
                 author_name=author_name,
                 version=version,
             )
         else:
             prompt = format_repo_overview_prompt(
                 repo_name=module_name,
-                repo_structure=json.dumps(repo_structure, indent=4),
+                repo_structure=repo_structure_json,
                 author_name=author_name,
                 version=version,
             )
 
         try:
-            parent_docs = await call_llm(prompt, self.config)
+            parent_docs = await call_llm_with_retry(prompt, self.config)
 
             # Parse and save parent documentation
-            # Parse and save parent documentation
-            if "<OVERVIEW>" in parent_docs and "</OVERVIEW>" in parent_docs:
-                parent_content = parent_docs.split("<OVERVIEW>")[1].split("</OVERVIEW>")[0].strip()
+            match = OVERVIEW_PATTERN.search(parent_docs)
+            if match:
+                parent_content = match.group(1).strip()
             else:
                 logger.warning(
-                    f"Using full response for parent docs of {module_name} (missing tags)"
+                    "Using full response for parent docs of %s (missing tags)", module_name
                 )
                 parent_content = parent_docs.strip()
 
             file_manager.save_text(parent_content, parent_docs_path)
+            if working_dir in self._present_docs:
+                self._present_docs[working_dir].add(parent_docs_filename)
 
-            logger.debug(f"Successfully generated parent documentation for: {module_name}")
+            logger.debug("Successfully generated parent documentation for: %s", module_name)
             return module_tree
 
         except Exception as e:
-            logger.error(f"Error generating parent documentation for {module_name}: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error(
+                "Error generating parent documentation for %s: %s", module_name, e, exc_info=True
+            )
             raise
 
     async def run(
@@ -403,11 +576,15 @@ class DocumentationGenerator:
         progress_callback: Optional[Callable[[int, int, str, bool], None]] = None,
     ) -> None:
         """Run the complete documentation generation process using dynamic programming."""
+        # Process-wide caches start empty for each run; file hashes are re-seeded from
+        # this run's state, so another repository's entries don't accumulate
+        clear_llm_cache()
+        clear_file_hash_cache()
         try:
             # Build dependency graph
             components, leaf_nodes = self.graph_builder.build_dependency_graph()
 
-            logger.debug(f"Found {len(leaf_nodes)} leaf nodes")
+            logger.debug("Found %s leaf nodes", len(leaf_nodes))
             # logger.debug(f"Leaf nodes:\n{'\n'.join(sorted(leaf_nodes)[:200])}")
             # exit()
 
@@ -436,7 +613,9 @@ class DocumentationGenerator:
                 last_commit_id = state_manager.get_last_commit_id()
                 if last_commit_id and last_commit_id != self.commit_id:
                     logger.warning(
-                        f"♻️  Commit changed ({last_commit_id[:7] if last_commit_id else 'None'} -> {self.commit_id[:7]}). Verifying structural changes."
+                        "♻️  Commit changed (%s -> %s). Verifying structural changes.",
+                        last_commit_id[:7],
+                        self.commit_id[:7],
                     )
                     # We trust structure hash primarily, but commit ID gives us a good reason to be suspicious.
                     # If both changed, we definitely re-cluster. Detailed git diff check could be here.
@@ -450,16 +629,25 @@ class DocumentationGenerator:
 
             # Check if module tree exists
             if os.path.exists(first_module_tree_path):
-                logger.debug(f"Module tree found at {first_module_tree_path}")
-                module_tree = file_manager.load_json(first_module_tree_path)
+                logger.debug("Module tree found at %s", first_module_tree_path)
+                # Copy the bytes rather than re-serializing the parsed tree
+                with open(first_module_tree_path, "rb") as f:
+                    file_manager.save_bytes(f.read(), module_tree_path)
+                module_tree = self._cached_load_json(first_module_tree_path)
             else:
-                logger.debug(f"Module tree not found at {module_tree_path}, clustering modules")
+                logger.debug("Module tree not found at %s, clustering modules", module_tree_path)
                 module_tree = await cluster_modules(leaf_nodes, components, self.config)
-                file_manager.save_json(module_tree, first_module_tree_path)
-
-            file_manager.save_json(module_tree, module_tree_path)
+                # Serialize once, write both copies
+                payload = file_manager.dumps_json(module_tree)
+                file_manager.save_bytes(payload, first_module_tree_path)
+                file_manager.save_bytes(payload, module_tree_path)
+                # The clustered tree is exactly what first_module_tree.json now holds
+                self._json_cache[first_module_tree_path] = (
+                    os.stat(first_module_tree_path).st_mtime_ns,
+                    module_tree,
+                )
 
-            logger.debug(f"Grouped components into {len(module_tree)} modules")
+            logger.debug("Grouped components into %s modules", len(module_tree))
 
             # Generate module documentation using dynamic programming approach
             # This processes leaf modules first, then parent modules
@@ -469,23 +657,32 @@ class DocumentationGenerator:
                 force=force,
                 resume=resume,
                 progress_callback=progress_callback,
+                state_manager=state_manager,
             )
 
             # Create documentation metadata
             self.create_documentation_metadata(working_dir, components, len(leaf_nodes))
 
             logger.debug(
-                f"Documentation generation completed successfully using dynamic programming!"
+                "Documentation generation completed successfully using dynamic programming!"
+            )
+            logger.debug(
+                "Processing order: leaf modules → parent modules → repository overview"
+            )
+            logger.debug("Documentation saved to: %s", working_dir)
+            cache_stats = get_llm_cache_stats()
+            logger.debug(
+                "LLM response cache: %s hits, %s misses",
+                cache_stats["hits"],
+                cache_stats["misses"],
             )
-            logger.debug(f"Processing order: leaf modules → parent modules → repository overview")
-            logger.debug(f"Documentation saved to: {working_dir}")
 
             # Update State with new structure hash and commit ID
-            state_manager.set_structure_hash(current_structure_hash)
-            if self.commit_id:
-                state_manager.set_commit_id(self.commit_id)
+            with state_manager.batch():
+                state_manager.set_structure_hash(current_structure_hash)
+                if self.commit_id:
+                    state_manager.set_commit_id(self.commit_id)
 
         except Exception as e:
-            logger.error(f"Documentation generation failed: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error("Documentation generation failed: %s", e, exc_info=True)
             raise
@@ -1,57 +1,122 @@
 import hashlib
-from typing import Dict, List, Any
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Below this many unhashed files, a thread pool costs more than it saves
+PARALLEL_HASH_THRESHOLD = 8
+
+# File hashes for this process, keyed by path and validated by (st_mtime_ns, st_size),
+# so files shared by many modules (or hashed again by sub-module tools) are read once.
+_file_hash_cache: Dict[str, Tuple[int, int, str]] = {}
+
+# Shared pool for hashing files; created on first use. Hashing is mostly disk I/O and
+# releases the GIL, so threads oversubscribe the CPUs the way stdlib I/O pools do.
+_hash_pool: Optional[ThreadPoolExecutor] = None
+_hash_pool_lock = threading.Lock()
+
+
+def _get_hash_pool() -> ThreadPoolExecutor:
+    """Return the shared file hashing pool, creating it on first use."""
+    global _hash_pool
+    if _hash_pool is None:
+        with _hash_pool_lock:
+            if _hash_pool is None:
+                _hash_pool = ThreadPoolExecutor(
+                    max_workers=min(32, (os.cpu_count() or 1) * 4),
+                    thread_name_prefix="gatomia-hash",
+                )
+    return _hash_pool
+
+
+def clear_file_hash_cache() -> None:
+    """Forget all cached file hashes."""
+    _file_hash_cache.clear()
+
+
+def load_file_hash_index(index: Dict[str, List[Any]]) -> None:
+    """
+    Seed the file hash cache from a persisted index.
+
+    Args:
+        index: Mapping of file path -> [mtime_ns, size, hash], as produced by
+            export_file_hash_index(). Entries already in the cache take precedence.
+    """
+    for file_path, entry in index.items():
+        if file_path not in _file_hash_cache and len(entry) == 3:
+            _file_hash_cache[file_path] = tuple(entry)
+
+
+def export_file_hash_index() -> Dict[str, List[Any]]:
+    """Return the file hash cache as a JSON-serializable index."""
+    return {file_path: list(entry) for file_path, entry in _file_hash_cache.items()}
+
 
 def calculate_file_hash(file_path: str) -> str:
     """Calculate SHA-256 hash of a file."""
-    sha256_hash = hashlib.sha256()
     try:
+        # An unchanged (mtime, size) means the cached hash is current; skip reading the file
+        cached = _file_hash_cache.get(file_path)
+        if cached is not None:
+            stat = os.stat(file_path)
+            if cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                return cached[2]
+
         with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+            stat = os.fstat(f.fileno())
+            # file_digest reads in large blocks and hashes without holding the GIL
+            file_hash = hashlib.file_digest(f, "sha256").hexdigest()
+        _file_hash_cache[file_path] = (stat.st_mtime_ns, stat.st_size, file_hash)
+        return file_hash
     except Exception as e:
-        logger.warning(f"Failed to calculate hash for {file_path}: {e}")
+        logger.warning("Failed to calculate hash for %s: %s", file_path, e)
         return ""
 
 
-def calculate_module_hash(components: List[str], all_components: Dict[str, Any]) -> str:
+def calculate_module_hash(
+    components: List[str],
+    all_components: Dict[str, Any],
+    file_hashes: Optional[Dict[str, str]] = None,
+) -> str:
     """
     Calculate a combined hash for a module based on its components.
 
     Args:
         components: List of component IDs in the module.
         all_components: Dictionary mapping component IDs to node objects.
+        file_hashes: Optional cache of file path -> file hash, shared across calls so
+            files referenced by several modules are only read and hashed once.
 
     Returns:
         A SHA-256 hash representing the combined state of the module's components.
     """
-    combined_hash = hashlib.sha256()
-
     # Sort components to ensure deterministic order
     sorted_components = sorted(components)
 
-    files_processed = set()
-
+    # We hash the file content once per file, but multiple components might be in one file.
+    # Alternatively, we can hash the component's source code if available, but file hash is robust.
+    # To strictly follow "updates", a file change should invalidate modules using it.
+    file_paths: Dict[str, None] = {}
     for comp_id in sorted_components:
-        if comp_id not in all_components:
-            continue
-
-        comp_node = all_components[comp_id]
-        file_path = comp_node.file_path
+        comp_node = all_components.get(comp_id)
+        if comp_node is not None:
+            file_paths.setdefault(comp_node.file_path)
 
-        # We hash the file content once per file, but multiple components might be in one file.
-        # Alternatively, we can hash the component's source code if available, but file hash is robust.
-        # To strictly follow "updates", a file change should invalidate modules using it.
+    if file_hashes is None:
+        file_hashes = {}
+    missing = [path for path in file_paths if path not in file_hashes]
+    if len(missing) >= PARALLEL_HASH_THRESHOLD:
+        file_hashes.update(zip(missing, _get_hash_pool().map(calculate_file_hash, missing)))
+    else:
+        for path in missing:
+            file_hashes[path] = calculate_file_hash(path)
 
-        if file_path in files_processed:
-            continue
-
-        file_hash = calculate_file_hash(file_path)
-        combined_hash.update(file_hash.encode("utf-8"))
-        files_processed.add(file_path)
+    combined_hash = hashlib.sha256()
+    for path in file_paths:
+        combined_hash.update(file_hashes[path].encode("utf-8"))
 
     return combined_hash.hexdigest()
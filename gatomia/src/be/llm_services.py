@@ -2,19 +2,33 @@
 LLM service factory for creating configured LLM clients.
 """
 
-from typing import Any, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from collections import OrderedDict
 import asyncio
+import hashlib
+import json
 import logging
+import os
+import random
+import weakref
 from contextlib import asynccontextmanager
 
 from pydantic_ai.models import Model, ModelSettings
 from pydantic_ai.models.openai import OpenAIModel
-from pydantic_ai.models.anthropic import AnthropicModel
 from pydantic_ai.exceptions import UnexpectedModelBehavior
 import openai
-from anthropic import AsyncAnthropic
 from pydantic import ValidationError
-from pydantic_ai.models.openai import OpenAIModelSettings
 from pydantic_ai.models.fallback import FallbackModel
 from pydantic_ai.messages import (
     ModelMessage,
@@ -22,17 +36,148 @@ from pydantic_ai.messages import (
     ModelRequest,
     TextPart,
 )
-from openai import OpenAI
-
-# Import Copilot SDK
-# Note: In a real environment, we'd handle potential import errors if the SDK isn't installed,
-# but here we assume it is as per requirements.
-from copilot import CopilotClient
+from openai import AsyncOpenAI, OpenAI
 
 from gatomia.src.config import Config
 
+# The Anthropic and Copilot SDKs are imported on first use of their provider, so runs
+# with another provider don't pay for loading them.
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
+    from copilot import CopilotClient
+    from pydantic_ai.models.anthropic import AnthropicModel
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Upper bound in seconds on a single retry delay, including a provider's Retry-After
+RETRY_MAX_DELAY = 30.0
+
+# Placeholder base URL of a local proxy; it is never passed on to the Anthropic client
+_DEFAULT_LOCAL_BASE_URL = "http://0.0.0.0:4000/"
+# Request extra_body enabling reasoning; shared by every request, so never mutate it
+_REASONING_EXTRA_BODY = {"reasoning": {"enabled": True}}
+
+
+def is_transient_llm_error(error: BaseException) -> bool:
+    """Whether an LLM call error is worth retrying; most 4xx client errors are not."""
+    status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int) and 400 <= status_code < 500:
+        return status_code in (408, 409, 429)
+    return True
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Get the provider's Retry-After delay from an HTTP error or its causes, if any."""
+    while error is not None:
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers is not None:
+            try:
+                return float(headers.get("retry-after"))
+            except (TypeError, ValueError):
+                pass
+        error = error.__cause__ or error.__context__
+    return None
+
+
+class _LoopClientPool:
+    """Async LLM clients bound to one event loop."""
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        # Started CopilotClients keyed by auth token
+        self.copilot: Dict[Optional[str], "CopilotClient"] = {}
+        # AsyncAnthropic clients keyed by (api_key, base_url)
+        self.anthropic: Dict[Tuple[Optional[str], Optional[str]], "AsyncAnthropic"] = {}
+        # AsyncOpenAI clients keyed by (base_url, api_key)
+        self.openai: Dict[Tuple[Optional[str], Optional[str]], AsyncOpenAI] = {}
+
+
+# Async clients hold connections tied to the event loop that opened them (and starting a
+# CopilotClient launches the Copilot CLI server), so they are created once per loop and
+# shared by every request on it.
+_loop_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClientPool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_loop_pool() -> _LoopClientPool:
+    """Return the client pool of the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _loop_pools.get(loop)
+    if pool is None:
+        pool = _loop_pools[loop] = _LoopClientPool()
+    return pool
+
+
+async def get_copilot_client(config: Config) -> "CopilotClient":
+    """Return a started CopilotClient shared by all requests on the running event loop."""
+    from copilot import CopilotClient
+
+    pool = _get_loop_pool()
+    token = config.copilot_token or None
+    client = pool.copilot.get(token)
+    if client is None:
+        async with pool.lock:
+            client = pool.copilot.get(token)
+            if client is None:
+                client = CopilotClient({"token": token}) if token else CopilotClient()
+                await client.start()
+                pool.copilot[token] = client
+    return client
+
+
+def get_anthropic_client(api_key: Optional[str], base_url: Optional[str]) -> "AsyncAnthropic":
+    """Return an AsyncAnthropic client shared by all requests on the running event loop."""
+    from anthropic import AsyncAnthropic
+
+    pool = _get_loop_pool()
+    key = (api_key, base_url)
+    client = pool.anthropic.get(key)
+    if client is None:
+        client = pool.anthropic[key] = AsyncAnthropic(
+            api_key=api_key, base_url=base_url, timeout=600.0
+        )
+    return client
+
+
+def get_async_openai_client(config: Config) -> AsyncOpenAI:
+    """Return an AsyncOpenAI client shared by all requests on the running event loop."""
+    pool = _get_loop_pool()
+    key = (config.llm_base_url, config.llm_api_key)
+    client = pool.openai.get(key)
+    if client is None:
+        client = pool.openai[key] = AsyncOpenAI(
+            base_url=config.llm_base_url, api_key=config.llm_api_key
+        )
+    return client
+
+
+async def close_llm_clients() -> None:
+    """Stop the shared LLM clients created on the running event loop."""
+    pool = _loop_pools.pop(asyncio.get_running_loop(), None)
+    if pool is None:
+        return
+    for client in pool.copilot.values():
+        try:
+            await client.stop()
+        except Exception as e:
+            logger.warning(f"Failed to stop Copilot client: {e}")
+    for client in pool.anthropic.values():
+        await client.close()
+    for client in pool.openai.values():
+        await client.close()
+
+
+async def run_and_close_llm_clients(coro: Awaitable[T]) -> T:
+    """Await coro, then stop the shared LLM clients it started (for use with asyncio.run)."""
+    try:
+        return await coro
+    finally:
+        await close_llm_clients()
+
 
 class CopilotModel(Model):
     """
@@ -42,7 +187,6 @@ class CopilotModel(Model):
     def __init__(self, model_name: str, config: Config):
         self._model_name = model_name
         self.config = config
-        self._client: Optional[CopilotClient] = None
 
     @property
     def model_name(self) -> str:
@@ -81,13 +225,18 @@ class CopilotModel(Model):
             # We'll concatenate messages for now or use the last user message.
             # Ideally we should use the proper chat format if SDK supports it.
 
-            prompt = ""
-            for msg in messages:
-                for part in msg.parts:
-                    if isinstance(part, TextPart):
-                        prompt += f"{part.content}\n"
+            chunks = [
+                part.content
+                for msg in messages
+                for part in msg.parts
+                if isinstance(part, TextPart)
+            ]
+            prompt = "\n".join(chunks) + ("\n" if chunks else "")
 
-            response = await session.send_and_wait({"prompt": prompt})
+            try:
+                response = await session.send_and_wait({"prompt": prompt})
+            finally:
+                await session.destroy()
 
             # Extract content from response
             # Assuming response.data.content based on research
@@ -97,18 +246,8 @@ class CopilotModel(Model):
 
     @asynccontextmanager
     async def _get_client(self):
-        # We create a new client or manage a lifecycle.
-        # For simple request/response, creating/stopping is safe but maybe inefficient.
-        auth_info = {}
-        if self.config.copilot_token:
-            auth_info["token"] = self.config.copilot_token
-
-        client = CopilotClient(auth_info) if auth_info else CopilotClient()
-        try:
-            await client.start()
-            yield client
-        finally:
-            await client.stop()
+        # The client is shared and stays started; close_llm_clients() stops it
+        yield await get_copilot_client(self.config)
 
 
 class OpenRouterModel(OpenAIModel):
@@ -130,13 +269,15 @@ class OpenRouterModel(OpenAIModel):
         model_request: Optional[ModelRequest] = None,
     ) -> ModelResponse:
         """Override request to include reasoning flag and handle validation errors."""
-        # Inject include_reasoning into extra_body if not present
+        # Inject include_reasoning into extra_body if not present. Settings may be shared
+        # between concurrent requests, so a copy is updated rather than the caller's dict.
         if self.include_reasoning:
-            if model_settings is None:
-                model_settings = OpenAIModelSettings()
-            if model_settings.extra_body is None:
-                model_settings.extra_body = {}
-            model_settings.extra_body["reasoning"] = {"enabled": True}
+            extra_body = (model_settings or {}).get("extra_body") or {}
+            if "reasoning" not in extra_body:
+                model_settings = {
+                    **(model_settings or {}),
+                    "extra_body": {**extra_body, "reasoning": _REASONING_EXTRA_BODY["reasoning"]},
+                }
 
         try:
             return await super().request(messages, model_settings, model_request)
@@ -146,102 +287,100 @@ class OpenRouterModel(OpenAIModel):
                 f"Model response validation failed: {e.json()}", raw_detail=e.json()
             ) from e
         except openai.APIStatusError as e:
-            logger.error(f"OpenRouter API Error: {e.response.text}")
-            raise UnexpectedModelBehavior(
-                f"OpenRouter API error: {e.response.text}", raw_detail=e.response.text
-            ) from e
-        except Exception as e:
-            # Catch other potential errors and wrap them
-            logger.error(f"OpenRouter unexpected error: {e}")
-            raise UnexpectedModelBehavior(f"OpenRouter unexpected error: {e}") from e
-
+            body = e.response.text
+            logger.error("OpenRouter API Error: %s", body)
+            raise UnexpectedModelBehavior(f"OpenRouter API error: {body}", raw_detail=body) from e
 
-def create_main_model(config: Config) -> Union[OpenRouterModel, CopilotModel, AnthropicModel]:
-    """Create the main LLM model from configuration."""
-    if config.llm_provider == "copilot":
-        return CopilotModel(model_name=config.main_model, config=config)
 
+def _apply_llm_env(config: Config) -> None:
+    """Export the endpoint and key read by the pydantic-ai provider clients."""
     if config.llm_provider == "anthropic":
         if config.llm_api_key:
-            import os
-
             os.environ["ANTHROPIC_API_KEY"] = config.llm_api_key
 
-        # Only set custom base URL if it's not the default localhost (which is for local proxies/copilot)
-        # and not empty.
-        default_base_url = "http://0.0.0.0:4000/"
-        if config.llm_base_url and config.llm_base_url != default_base_url:
-            import os
-
+        # Only set custom base URL if it's not the default localhost (which is for local
+        # proxies/copilot) and not empty.
+        if config.llm_base_url and config.llm_base_url != _DEFAULT_LOCAL_BASE_URL:
             os.environ["ANTHROPIC_BASE_URL"] = config.llm_base_url
+    elif config.llm_provider != "copilot":
+        # Set environment variables for pydantic-ai OpenAIModel
+        if config.llm_base_url:
+            os.environ["OPENAI_BASE_URL"] = config.llm_base_url
+        if config.llm_api_key:
+            os.environ["OPENAI_API_KEY"] = config.llm_api_key
 
-        # Pass explicit timeout to avoid "Streaming is required" error for >10min requests
-        return AnthropicModel(config.main_model, settings={"timeout": 600.0})
 
-    # Set environment variables for pydantic-ai OpenAIModel
-    if config.llm_base_url:
-        import os
+def _create_model(
+    config: Config, model_name: str
+) -> Union[OpenRouterModel, CopilotModel, "AnthropicModel"]:
+    """Create an LLM model for the configured provider."""
+    if config.llm_provider == "copilot":
+        return CopilotModel(model_name=model_name, config=config)
 
-        os.environ["OPENAI_BASE_URL"] = config.llm_base_url
-    if config.llm_api_key:
-        import os
+    _apply_llm_env(config)
 
-        os.environ["OPENAI_API_KEY"] = config.llm_api_key
+    if config.llm_provider == "anthropic":
+        from pydantic_ai.models.anthropic import AnthropicModel
+
+        # Pass explicit timeout to avoid "Streaming is required" error for >10min requests
+        return AnthropicModel(model_name, settings={"timeout": 600.0})
 
     return OpenRouterModel(
-        model_name=config.main_model,
+        model_name=model_name,
         include_reasoning=config.include_reasoning,
     )
 
 
-def create_fallback_model(config: Config) -> Union[OpenRouterModel, CopilotModel, AnthropicModel]:
-    """Create the fallback LLM model from configuration."""
-    if config.llm_provider == "copilot":
-        return CopilotModel(model_name=config.fallback_model, config=config)
+def create_main_model(config: Config) -> Union[OpenRouterModel, CopilotModel, "AnthropicModel"]:
+    """Create the main LLM model from configuration."""
+    return _create_model(config, config.main_model)
 
-    if config.llm_provider == "anthropic":
-        if config.llm_api_key:
-            import os
 
-            os.environ["ANTHROPIC_API_KEY"] = config.llm_api_key
+def create_fallback_model(config: Config) -> Union[OpenRouterModel, CopilotModel, "AnthropicModel"]:
+    """Create the fallback LLM model from configuration."""
+    return _create_model(config, config.fallback_model)
 
-        # Only set custom base URL if it's not the default localhost
-        # Only set custom base URL if it's not the default localhost
-        default_base_url = "http://0.0.0.0:4000/"
-        if config.llm_base_url and config.llm_base_url != default_base_url:
-            import os
 
-            os.environ["ANTHROPIC_BASE_URL"] = config.llm_base_url
+def create_fallback_models(config: Config) -> FallbackModel:
+    """Create fallback models chain from configuration."""
+    main = _create_model(config, config.main_model)
+    fallback = _create_model(config, config.fallback_model)
+    return FallbackModel(main, fallback)
 
-        # Pass explicit timeout
-        return AnthropicModel(config.fallback_model, settings={"timeout": 600.0})
 
-    # Set environment variables just in case (though main model creation likely set them)
-    if config.llm_base_url:
-        import os
+def create_openai_client(config: Config) -> OpenAI:
+    """Create OpenAI client from configuration."""
+    return OpenAI(base_url=config.llm_base_url, api_key=config.llm_api_key)
 
-        os.environ["OPENAI_BASE_URL"] = config.llm_base_url
-    if config.llm_api_key:
-        import os
 
-        os.environ["OPENAI_API_KEY"] = config.llm_api_key
+# Responses to deterministic (temperature 0) requests, keyed by a digest of the request
+LLM_RESPONSE_CACHE_SIZE = 256
+_llm_response_cache: "OrderedDict[str, str]" = OrderedDict()
+_llm_cache_stats = {"hits": 0, "misses": 0}
 
-    return OpenRouterModel(
-        model_name=config.fallback_model,
-        include_reasoning=config.include_reasoning,
-    )
 
+def get_llm_cache_stats() -> Dict[str, int]:
+    """Return hit/miss counts of the call_llm response cache."""
+    return dict(_llm_cache_stats)
 
-def create_fallback_models(config: Config) -> FallbackModel:
-    """Create fallback models chain from configuration."""
-    main = create_main_model(config)
-    fallback = create_fallback_model(config)
-    return FallbackModel(main, fallback)
 
+def clear_llm_cache() -> None:
+    """Drop all cached call_llm responses and reset the hit/miss counts."""
+    _llm_response_cache.clear()
+    _llm_cache_stats.update(hits=0, misses=0)
 
-def create_openai_client(config: Config) -> OpenAI:
-    """Create OpenAI client from configuration."""
-    return OpenAI(base_url=config.llm_base_url, api_key=config.llm_api_key)
+
+def _llm_cache_key(prompt: str, config: Config, model: str, include_reasoning: bool) -> str:
+    """Digest everything that determines a deterministic response."""
+    request = {
+        "provider": config.llm_provider,
+        "base_url": config.llm_base_url,
+        "model": model,
+        "max_tokens": config.max_tokens,
+        "reasoning": include_reasoning,
+        "prompt": prompt,
+    }
+    return hashlib.sha256(json.dumps(request, sort_keys=True).encode("utf-8")).hexdigest()
 
 
 async def call_llm(
@@ -263,6 +402,9 @@ async def call_llm(
 
     Returns:
         LLM response text
+
+    Responses to temperature 0 requests are cached in memory, so an identical request
+    in the same process is answered without calling the provider again.
     """
     if model is None:
         model = config.main_model
@@ -270,29 +412,46 @@ async def call_llm(
     if include_reasoning is None:
         include_reasoning = config.include_reasoning
 
+    if temperature != 0.0:
+        return await _call_provider(prompt, config, model, temperature, include_reasoning)
+
+    key = _llm_cache_key(prompt, config, model, include_reasoning)
+    cached = _llm_response_cache.get(key)
+    if cached is not None:
+        _llm_response_cache.move_to_end(key)
+        _llm_cache_stats["hits"] += 1
+        return cached
+
+    _llm_cache_stats["misses"] += 1
+    response = await _call_provider(prompt, config, model, temperature, include_reasoning)
+    if response:
+        _llm_response_cache[key] = response
+        if len(_llm_response_cache) > LLM_RESPONSE_CACHE_SIZE:
+            _llm_response_cache.popitem(last=False)
+    return response
+
+
+async def _call_provider(
+    prompt: str, config: Config, model: str, temperature: float, include_reasoning: bool
+) -> str:
+    """Send a single prompt to the configured provider."""
     if config.llm_provider == "copilot":
         # Copilot implementation
-        auth_info = {}
-        if config.copilot_token:
-            auth_info["token"] = config.copilot_token
-
-        client = CopilotClient(auth_info) if auth_info else CopilotClient()
+        client = await get_copilot_client(config)
+        session = await client.create_session({"model": model})
         try:
-            await client.start()
-            session = await client.create_session({"model": model})
             response = await session.send_and_wait({"prompt": prompt})
-            return response.data.content
         finally:
-            await client.stop()
+            await session.destroy()
+        return response.data.content
     elif config.llm_provider == "anthropic":
         # Anthropic implementation
         # Check for custom base URL (ignoring default localhost)
-        default_base_url = "http://0.0.0.0:4000/"
         base_url = None
-        if config.llm_base_url and config.llm_base_url != default_base_url:
+        if config.llm_base_url and config.llm_base_url != _DEFAULT_LOCAL_BASE_URL:
             base_url = config.llm_base_url
 
-        client = AsyncAnthropic(api_key=config.llm_api_key, base_url=base_url, timeout=600.0)
+        client = get_anthropic_client(config.llm_api_key, base_url)
         response = await client.messages.create(
             model=model,
             max_tokens=config.max_tokens,
@@ -301,31 +460,82 @@ async def call_llm(
         )
         return response.content[0].text
     else:
-        # OpenAI implementation (wrapped in asyncio)
-        client = create_openai_client(config)
-
-        # Run synchronous OpenAI call in a thread to keep this function async
-        return await asyncio.to_thread(
-            _call_openai_sync,
-            client,
-            model,
-            prompt,
-            temperature,
-            config.max_tokens,
-            include_reasoning,
+        # OpenAI implementation
+        client = get_async_openai_client(config)
+        response = await client.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=temperature,
+            max_tokens=config.max_tokens,
+            extra_body=_REASONING_EXTRA_BODY if include_reasoning else None,
         )
+        return response.choices[0].message.content
 
 
-def _call_openai_sync(client, model, prompt, temperature, max_tokens, include_reasoning=False):
-    extra_body = {}
-    if include_reasoning:
-        extra_body["reasoning"] = {"enabled": True}
+async def call_llm_with_retry(
+    prompt: str, config: Config, max_retries: int = 3, **kwargs: Any
+) -> str:
+    """
+    Call LLM like call_llm, retrying transient errors with jittered exponential backoff.
+
+    Client errors other than timeouts, conflicts and rate limits are raised immediately.
+    A provider's Retry-After header takes precedence over the backoff delay; both are capped
+    at RETRY_MAX_DELAY.
+    """
+    retry_delay = 2
+    for attempt in range(max_retries):
+        try:
+            return await call_llm(prompt, config, **kwargs)
+        except Exception as e:
+            if attempt == max_retries - 1 or not is_transient_llm_error(e):
+                raise
+            # Jitter keeps concurrent callers from retrying in lockstep
+            delay = min(
+                RETRY_MAX_DELAY,
+                retry_after_seconds(e) or retry_delay * (0.5 + random.random()),
+            )
+            logger.warning(
+                f"LLM call failed (attempt {attempt + 1}/{max_retries}): {e}. "
+                f"Retrying in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+            retry_delay *= 2
+
+
+async def call_llm_many(
+    prompts: List[str],
+    config: Config,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+    **kwargs: Any,
+) -> List[Union[str, BaseException]]:
+    """
+    Call LLM for several independent prompts concurrently.
+
+    At most ``config.llm_concurrency`` requests are in flight at once, and each one is
+    retried like call_llm_with_retry.
+
+    Args:
+        prompts: The prompts to send
+        config: Configuration containing LLM settings
+        on_progress: Optional callback invoked with (completed, total) after each prompt
+        **kwargs: Passed through to call_llm
+
+    Returns:
+        Responses in prompt order; a prompt that failed yields its exception instead
+    """
+    semaphore = asyncio.Semaphore(config.llm_concurrency)
+    total = len(prompts)
+    completed = 0
+
+    async def call_one(prompt: str) -> str:
+        nonlocal completed
+        try:
+            async with semaphore:
+                return await call_llm_with_retry(prompt, config, **kwargs)
+        finally:
+            completed += 1
+            if on_progress:
+                on_progress(completed, total)
+
+    return await asyncio.gather(*(call_one(p) for p in prompts), return_exceptions=True)
 
-    response = client.chat.completions.create(
-        model=model,
-        messages=[{"role": "user", "content": prompt}],
-        temperature=temperature,
-        max_tokens=max_tokens,
-        extra_body=extra_body,
-    )
-    return response.choices[0].message.content
@@ -23,6 +23,7 @@ logger = logging.getLogger(__name__)
 
 # Local imports
 from gatomia.src.be.documentation_generator import DocumentationGenerator
+from gatomia.src.be.llm_services import run_and_close_llm_clients
 from gatomia.src.config import (
     Config,
 )
@@ -58,4 +59,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(run_and_close_llm_clients(main()))
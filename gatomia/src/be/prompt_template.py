@@ -1,3 +1,5 @@
+import os
+from collections import defaultdict
 from typing import Dict, Any, Optional, List
 from gatomia.src.utils import file_manager
 
@@ -352,6 +354,69 @@ EXTENSION_TO_LANGUAGE = {
 }
 
 
+def _format_module_tree(module_tree: dict[str, any], module_name: Optional[str]) -> str:
+    """Render the module tree as an indented outline, marking module_name as current."""
+    lines = []
+
+    def _walk(tree: dict[str, any], pad: str) -> None:
+        # Padding is built once per level rather than once per line
+        child_pad = pad + "  "
+        for key, value in tree.items():
+            if key == module_name:
+                lines.append(f"{pad}{key} (current module)")
+            else:
+                lines.append(f"{pad}{key}")
+
+            lines.append(f"{child_pad} Core components: {', '.join(value['components'])}")
+            children = value.get("children")
+            if isinstance(children, dict) and len(children) > 0:
+                lines.append(f"{child_pad} Children:")
+                _walk(children, child_pad + "  ")
+
+    _walk(module_tree, "")
+    return "\n".join(lines)
+
+
+def _truncate_code(code: str, limit: int) -> str:
+    """Cut code to at most limit characters, at a line break near the limit if there is one."""
+    cut = code.rfind("\n", max(0, limit - 200), limit)
+    if cut == -1:
+        cut = limit
+    return code[:cut] + "\n# ... [truncated]"
+
+
+def _allocate_char_limits(lengths: list[int], budget: int) -> list[Optional[int]]:
+    """
+    Share a character budget between code sections.
+
+    Sections that fit in an even share keep their full length and hand what they leave
+    unused to the larger ones.
+
+    Args:
+        lengths: Length of each section's code
+        budget: Total characters available to all sections
+
+    Returns:
+        Per-section limit, or None for sections that need no truncation
+    """
+    limits: list[Optional[int]] = [None] * len(lengths)
+    if sum(lengths) <= budget:
+        return limits
+
+    remaining = budget
+    pending = sorted(range(len(lengths)), key=lengths.__getitem__)
+    while pending:
+        share = remaining // len(pending)
+        index = pending[0]
+        if lengths[index] > share:
+            break
+        remaining -= lengths[index]
+        pending.pop(0)
+    for index in pending:
+        limits[index] = share
+    return limits
+
+
 def format_user_prompt(
     module_name: str,
     core_component_ids: list[str],
@@ -373,36 +438,17 @@ def format_user_prompt(
         Formatted user prompt string
     """
 
-    # format module tree
-    lines = []
-
-    def _format_module_tree(module_tree: dict[str, any], indent: int = 0):
-        for key, value in module_tree.items():
-            if key == module_name:
-                lines.append(f"{'  ' * indent}{key} (current module)")
-            else:
-                lines.append(f"{'  ' * indent}{key}")
-
-            lines.append(f"{'  ' * (indent + 1)} Core components: {', '.join(value['components'])}")
-            if isinstance(value["children"], dict) and len(value["children"]) > 0:
-                lines.append(f"{'  ' * (indent + 1)} Children:")
-                _format_module_tree(value["children"], indent + 2)
-
-    _format_module_tree(module_tree, 0)
-    formatted_module_tree = "\n".join(lines)
+    formatted_module_tree = _format_module_tree(module_tree, module_name)
 
     # print(f"Formatted module tree:\n{formatted_module_tree}")
 
     # Group core component IDs by their file path
-    grouped_components: dict[str, list[str]] = {}
+    grouped_components: dict[str, list[str]] = defaultdict(list)
     for component_id in core_component_ids:
-        if component_id not in components:
+        component = components.get(component_id)
+        if component is None:
             continue
-        component = components[component_id]
-        path = component.relative_path
-        if path not in grouped_components:
-            grouped_components[path] = []
-        grouped_components[path].append(component_id)
+        grouped_components[component.relative_path].append(component_id)
 
     # Calculate per-file character limit if max_tokens is set
     # Crude estimation: 1 token ~= 4 characters
@@ -411,16 +457,33 @@ def format_user_prompt(
         total_char_limit = max_tokens * 4
         char_limit_per_file = total_char_limit // len(grouped_components)
 
-    core_component_codes = ""
-    core_component_codes = ""
+    # Files read for this prompt; components from the same file share one read
+    file_texts: dict[str, str] = {}
+    file_lines: dict[str, list[str]] = {}
+
+    def _load_text(file_path: str) -> str:
+        text = file_texts.get(file_path)
+        if text is None:
+            text = file_texts[file_path] = file_manager.load_text(file_path)
+        return text
+
+    def _load_lines(file_path: str) -> list[str]:
+        split = file_lines.get(file_path)
+        if split is None:
+            split = file_lines[file_path] = _load_text(file_path).splitlines()
+        return split
+
+    # Code sections are collected and joined once; += on the growing string would copy it
+    # again for every section
+    parts: list[str] = []
+    append = parts.append
     for path, component_ids_in_file in grouped_components.items():
-        core_component_codes += f"# File: {path}\n"
+        append(f"# File: {path}\n")
 
         # Try to extract imports from the actual file
         try:
             # Just read the first 50 lines to catch imports, or full file if small
-            full_content = file_manager.load_text(components[component_ids_in_file[0]].file_path)
-            lines = full_content.splitlines()
+            lines = _load_lines(components[component_ids_in_file[0]].file_path)
             imports = []
             for line in lines:
                 stripped = line.strip()
@@ -434,18 +497,21 @@ def format_user_prompt(
                         break  # Safety break
 
             if imports:
-                core_component_codes += "## Imports/Context:\n```text\n"
-                core_component_codes += "\n".join(imports)
-                core_component_codes += "\n```\n"
+                append("## Imports/Context:\n```text\n")
+                append("\n".join(imports))
+                append("\n```\n")
 
         except Exception:
             pass  # Ignore import extraction errors
 
-        core_component_codes += "\n## Core Components in this file:\n"
+        append("\n## Core Components in this file:\n")
+        # All components here share the file, and so its language
+        lang = EXTENSION_TO_LANGUAGE.get(os.path.splitext(path)[1], "text")
 
+        # Gather the file's code first so its budget can go where it is needed
+        sections: list[tuple[Any, str]] = []
         for component_id in component_ids_in_file:
             component = components[component_id]
-            core_component_codes += f"### {component.name} ({component.component_type})\n"
 
             # Use source_code from Node if available, otherwise fallback to file reading logic
             code_content = component.source_code
@@ -455,22 +521,36 @@ def format_user_prompt(
                 # For now, if no source_code, we rely on the previous file read logic or just skip
                 # Assuming source_code is populated by the analyzer as per learnings
                 try:
-                    content = file_manager.load_text(component.file_path)
                     # If we have start/end lines, use them
                     if component.start_line > 0 and component.end_line >= component.start_line:
-                        file_lines = content.splitlines()
+                        source_lines = _load_lines(component.file_path)
                         # Adjust for 0-based indexing if needed, usually line numbers are 1-based
                         start = max(0, component.start_line - 1)
-                        end = min(len(file_lines), component.end_line)
-                        code_content = "\n".join(file_lines[start:end])
+                        end = min(len(source_lines), component.end_line)
+                        code_content = "\n".join(source_lines[start:end])
                     else:
-                        code_content = content  # Fallback to full content if no lines
+                        # Fallback to full content if no lines
+                        code_content = _load_text(component.file_path)
                 except Exception as e:
                     code_content = f"Error reading component code: {e}"
 
-            lang = EXTENSION_TO_LANGUAGE.get("." + path.split(".")[-1], "text")
-            core_component_codes += f"```{lang}\n{code_content}\n```\n\n"
+            sections.append((component, code_content))
 
+        # Truncate only when the file as a whole is over budget
+        if char_limit_per_file:
+            char_limits = _allocate_char_limits(
+                [len(code) for _, code in sections], char_limit_per_file
+            )
+        else:
+            char_limits = [None] * len(sections)
+
+        for (component, code_content), char_limit in zip(sections, char_limits):
+            append(f"### {component.name} ({component.component_type})\n")
+            if char_limit is not None and len(code_content) > char_limit:
+                code_content = _truncate_code(code_content, char_limit)
+            append(f"```{lang}\n{code_content}\n```\n\n")
+
+    core_component_codes = "".join(parts)
     return USER_PROMPT.format(
         module_name=module_name,
         formatted_core_component_codes=core_component_codes,
@@ -479,42 +559,20 @@ def format_user_prompt(
 
 
 def format_cluster_prompt(
-    potential_core_components: str, module_tree: dict[str, any] = {}, module_name: str = None
+    potential_core_components: str,
+    module_tree: Optional[dict[str, any]] = None,
+    module_name: str = None,
 ) -> str:
     """
     Format the cluster prompt with potential core components and module tree.
     """
-
-    # format module tree
-    lines = []
-
-    # print(f"Module tree:\n{json.dumps(module_tree, indent=2)}")
-
-    def _format_module_tree(module_tree: dict[str, any], indent: int = 0):
-        for key, value in module_tree.items():
-            if key == module_name:
-                lines.append(f"{'  ' * indent}{key} (current module)")
-            else:
-                lines.append(f"{'  ' * indent}{key}")
-
-            lines.append(f"{'  ' * (indent + 1)} Core components: {', '.join(value['components'])}")
-            if (
-                ("children" in value)
-                and isinstance(value["children"], dict)
-                and len(value["children"]) > 0
-            ):
-                lines.append(f"{'  ' * (indent + 1)} Children:")
-                _format_module_tree(value["children"], indent + 2)
-
-    _format_module_tree(module_tree, 0)
-    formatted_module_tree = "\n".join(lines)
-
-    if module_tree == {}:
+    # The repo-level prompt has no tree to show, so the tree is only rendered below
+    if not module_tree:
         return CLUSTER_REPO_PROMPT.format(potential_core_components=potential_core_components)
     else:
         return CLUSTER_MODULE_PROMPT.format(
             potential_core_components=potential_core_components,
-            module_tree=formatted_module_tree,
+            module_tree=_format_module_tree(module_tree, module_name),
             module_name=module_name,
         )
 
@@ -573,43 +631,49 @@ def format_leaf_system_prompt(
     ).strip()
 
 
+# The serialized repo structure can run to megabytes, so the overview templates are
+# split around it once: only the small head and tail go through str.format, and the
+# structure is copied into the prompt exactly once.
+_REPO_OVERVIEW_HEAD, _REPO_OVERVIEW_TAIL = REPO_OVERVIEW_PROMPT.split("{repo_structure}")
+_MODULE_OVERVIEW_HEAD, _MODULE_OVERVIEW_TAIL = MODULE_OVERVIEW_PROMPT.split("{repo_structure}")
+
+
 def format_repo_overview_prompt(
     repo_name: str, repo_structure: str, author_name: str, version: str
 ) -> str:
     """Format the repository overview prompt."""
-    return REPO_OVERVIEW_PROMPT.format(
-        repo_name=repo_name,
-        repo_structure=repo_structure,
-        author_name=author_name,
-        version=version,
-    ).strip()
+    fields = {"repo_name": repo_name, "author_name": author_name, "version": version}
+    return "".join(
+        (
+            _REPO_OVERVIEW_HEAD.format(**fields),
+            repo_structure,
+            _REPO_OVERVIEW_TAIL.format(**fields),
+        )
+    )
 
 
 def format_module_overview_prompt(
     module_name: str, repo_structure: str, author_name: str, version: str
 ) -> str:
     """Format the module overview prompt."""
-    return MODULE_OVERVIEW_PROMPT.format(
-        module_name=module_name,
-        repo_structure=repo_structure,
-        author_name=author_name,
-        version=version,
-    ).strip()
+    fields = {"module_name": module_name, "author_name": author_name, "version": version}
+    return "".join(
+        (
+            _MODULE_OVERVIEW_HEAD.format(**fields),
+            repo_structure,
+            _MODULE_OVERVIEW_TAIL.format(**fields),
+        )
+    )
 
 
-UPDATE_DOC_PROMPT = """
+# Update/create prompts are split into an instruction-independent prefix (role and
+# project context) and a per-request tail. The prefix can be rendered once per session
+# and stays byte-identical across requests, which also lets providers cache it.
+UPDATE_DOC_PREFIX_PROMPT = """
 <ROLE>
 You are an expert technical editor. Your task is to update the following documentation based on the user's request.
 </ROLE>
 
-<INPUT_DOCUMENT>
-{current_content}
-</INPUT_DOCUMENT>
-
-<USER_REQUEST>
-{user_instruction}
-</USER_REQUEST>
-
 <PROJECT_STRUCTURE>
 {repo_structure}
 </PROJECT_STRUCTURE>
@@ -621,6 +685,16 @@ You are an expert technical editor. Your task is to update the following documen
 <CONTEXT>
 {repo_context}
 </CONTEXT>
+""".strip()
+
+UPDATE_DOC_REQUEST_PROMPT = """
+<INPUT_DOCUMENT>
+{current_content}
+</INPUT_DOCUMENT>
+
+<USER_REQUEST>
+{user_instruction}
+</USER_REQUEST>
 
 <INSTRUCTIONS>
 1. Read the input document and the user request.
@@ -631,16 +705,14 @@ You are an expert technical editor. Your task is to update the following documen
 </INSTRUCTIONS>
 """.strip()
 
+UPDATE_DOC_PROMPT = UPDATE_DOC_PREFIX_PROMPT + "\n\n" + UPDATE_DOC_REQUEST_PROMPT
+
 
-CREATE_DOC_PROMPT = """
+CREATE_DOC_PREFIX_PROMPT = """
 <ROLE>
 You are an expert technical writer. Your task is to create a NEW documentation page based on the user's request.
 </ROLE>
 
-<USER_REQUEST>
-{user_instruction}
-</USER_REQUEST>
-
 <PROJECT_STRUCTURE>
 {repo_structure}
 </PROJECT_STRUCTURE>
@@ -652,6 +724,12 @@ You are an expert technical writer. Your task is to create a NEW documentation p
 <CONTEXT>
 {repo_context}
 </CONTEXT>
+""".strip()
+
+CREATE_DOC_REQUEST_PROMPT = """
+<USER_REQUEST>
+{user_instruction}
+</USER_REQUEST>
 
 <INSTRUCTIONS>
 1. Analyze the USER_REQUEST, PROJECT_STRUCTURE, and DEPENDENCIES.
@@ -665,6 +743,29 @@ You are an expert technical writer. Your task is to create a NEW documentation p
 </INSTRUCTIONS>
 """.strip()
 
+CREATE_DOC_PROMPT = CREATE_DOC_PREFIX_PROMPT + "\n\n" + CREATE_DOC_REQUEST_PROMPT
+
+
+def format_update_doc_prefix(
+    repo_structure: str = "",
+    dependency_graph: str = "",
+    repo_context: str = "",
+) -> str:
+    """Format the instruction-independent part of the documentation update prompt."""
+    return UPDATE_DOC_PREFIX_PROMPT.format(
+        repo_structure=repo_structure,
+        dependency_graph=dependency_graph,
+        repo_context=repo_context,
+    )
+
+
+def format_update_doc_request(current_content: str, user_instruction: str) -> str:
+    """Format the per-request part of the documentation update prompt."""
+    return UPDATE_DOC_REQUEST_PROMPT.format(
+        current_content=current_content,
+        user_instruction=user_instruction,
+    ).strip()
+
 
 def format_update_doc_prompt(
     current_content: str,
@@ -674,13 +775,26 @@ def format_update_doc_prompt(
     repo_context: str = "",
 ) -> str:
     """Format the documentation update prompt."""
-    return UPDATE_DOC_PROMPT.format(
-        current_content=current_content,
-        user_instruction=user_instruction,
+    prefix = format_update_doc_prefix(repo_structure, dependency_graph, repo_context)
+    return f"{prefix}\n\n{format_update_doc_request(current_content, user_instruction)}"
+
+
+def format_create_doc_prefix(
+    repo_structure: str = "",
+    dependency_graph: str = "",
+    repo_context: str = "",
+) -> str:
+    """Format the instruction-independent part of the documentation creation prompt."""
+    return CREATE_DOC_PREFIX_PROMPT.format(
         repo_structure=repo_structure,
         dependency_graph=dependency_graph,
         repo_context=repo_context,
-    ).strip()
+    )
+
+
+def format_create_doc_request(user_instruction: str) -> str:
+    """Format the per-request part of the documentation creation prompt."""
+    return CREATE_DOC_REQUEST_PROMPT.format(user_instruction=user_instruction).strip()
 
 
 def format_create_doc_prompt(
@@ -690,9 +804,5 @@ def format_create_doc_prompt(
     repo_context: str = "",
 ) -> str:
     """Format the documentation creation prompt."""
-    return CREATE_DOC_PROMPT.format(
-        user_instruction=user_instruction,
-        repo_structure=repo_structure,
-        dependency_graph=dependency_graph,
-        repo_context=repo_context,
-    ).strip()
+    prefix = format_create_doc_prefix(repo_structure, dependency_graph, repo_context)
+    return f"{prefix}\n\n{format_create_doc_request(user_instruction)}"
@@ -1,7 +1,10 @@
+import hashlib
 import json
 import os
 import logging
-from typing import Dict, Any, Optional
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional
 from datetime import datetime
 from gatomia.src.utils import file_manager
 
@@ -9,6 +12,9 @@ logger = logging.getLogger(__name__)
 
 STATE_FILENAME = "generation_state.json"
 
+# Inside a batch, state is written at most this often (seconds), bounding lost progress
+BATCH_FLUSH_INTERVAL = 5.0
+
 
 class StateManager:
     """Manages the state of documentation generation for checkpointing and incremental updates."""
@@ -17,6 +23,11 @@ class StateManager:
         self.working_dir = working_dir
         self.state_path = os.path.join(working_dir, STATE_FILENAME)
         self.state = self._load_state()
+        # Hashes of completed modules, so up-to-date checks are a single lookup
+        self._completed_hash = self._index_completed(self.state)
+        self._batch_depth = 0
+        self._dirty = False
+        self._last_write = 0.0
 
     def _load_state(self) -> Dict[str, Any]:
         """Load state from file or return empty state."""
@@ -28,14 +39,56 @@ class StateManager:
             "metadata": {"created_at": datetime.now().isoformat(), "last_run": None},
         }
 
+    @staticmethod
+    def _index_completed(state: Dict[str, Any]) -> Dict[str, str]:
+        """Map each completed module in state to its stored hash."""
+        return {
+            name: data["hash"]
+            for name, data in state["modules"].items()
+            if data.get("status") == "completed" and "hash" in data
+        }
+
     def save_state(self) -> None:
         """Save current state to file."""
-        self.state["metadata"]["last_run"] = datetime.now().isoformat()
-
         # We don't update structure_hash or commit_id here automatically
         # They should be set explicitly when we confirm the structure/commit is valid
 
-        file_manager.save_json(self.state, self.state_path)
+        if self._batch_depth and time.monotonic() - self._last_write < BATCH_FLUSH_INTERVAL:
+            self._dirty = True
+            return
+        self._write_state()
+
+    def _write_state(self) -> None:
+        """Write the state file now."""
+        # Stamped per write rather than per update; deferred updates share one timestamp
+        self.state["metadata"]["last_run"] = datetime.now().isoformat()
+        # Compact output: without indent, json uses its C encoder, and the file hash
+        # index would otherwise spread every entry over several lines
+        payload = json.dumps(self.state, separators=(",", ":")).encode("utf-8")
+        file_manager.save_bytes(payload, self.state_path)
+        self._dirty = False
+        self._last_write = time.monotonic()
+
+    def flush(self) -> None:
+        """Write any state changes deferred by an open batch."""
+        if self._dirty:
+            self._write_state()
+
+    @contextmanager
+    def batch(self) -> Iterator["StateManager"]:
+        """
+        Defer state writes while the block runs.
+
+        Updates are written at most every BATCH_FLUSH_INTERVAL seconds and once more
+        when the outermost batch exits, including on errors and cancellation.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
 
     def is_module_up_to_date(self, module_name: str, current_hash: str) -> bool:
         """
@@ -48,15 +101,8 @@ class StateManager:
         Returns:
             True if module exists in state, is completed, and hash matches.
         """
-        module_data = self.state["modules"].get(module_name)
-        if not module_data:
-            return False
-
-        if module_data.get("status") != "completed":
-            return False
-
-        stored_hash = module_data.get("hash")
-        return stored_hash == current_hash
+        stored_hash = self._completed_hash.get(module_name)
+        return stored_hash is not None and stored_hash == current_hash
 
     def update_module_state(
         self, module_name: str, hash_value: str, status: str = "completed"
@@ -67,16 +113,23 @@ class StateManager:
             "hash": hash_value,
             "timestamp": datetime.now().isoformat(),
         }
+        if status == "completed":
+            self._completed_hash[module_name] = hash_value
+        else:
+            self._completed_hash.pop(module_name, None)
         self.save_state()
 
     def calculate_structure_hash(self, leaf_nodes: list[str]) -> str:
         """Calculate a hash representing the current file structure."""
-        import hashlib
-
-        # Sort to ensure consistent ordering
-        sorted_files = sorted(leaf_nodes)
-        content = "\n".join(sorted_files)
-        return hashlib.md5(content.encode("utf-8")).hexdigest()
+        # Sort to ensure consistent ordering; paths are fed one at a time, newline-separated,
+        # which digests the same bytes as hashing the joined listing
+        digest = hashlib.md5()
+        separator = b""
+        for path in sorted(leaf_nodes):
+            digest.update(separator)
+            digest.update(path.encode("utf-8"))
+            separator = b"\n"
+        return digest.hexdigest()
 
     def get_last_structure_hash(self) -> Optional[str]:
         """Get the stored structure hash from the last run."""
@@ -96,10 +149,22 @@ class StateManager:
         self.state["metadata"]["commit_id"] = commit_id
         self.save_state()
 
+    def get_file_hashes(self) -> Dict[str, List[Any]]:
+        """Get the file hash index ([mtime_ns, size, hash] per path) from the last run."""
+        return self.state.get("file_hashes", {})
+
+    def set_file_hashes(self, index: Dict[str, List[Any]]) -> None:
+        """Update the stored file hash index."""
+        self.state["file_hashes"] = index
+        self.save_state()
+
     def clear_state(self) -> None:
         """Clear all state data (e.g., for force regeneration)."""
         self.state = {
             "modules": {},
             "metadata": {"created_at": datetime.now().isoformat(), "last_run": None},
         }
+        self._completed_hash = {}
+        # Written immediately even inside a batch, so a crash can't resurrect old state
         self.save_state()
+        self.flush()
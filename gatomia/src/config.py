@@ -18,6 +18,8 @@ MAX_DEPTH = 2
 DEFAULT_MAX_TOKENS = 32_768
 DEFAULT_MAX_TOKEN_PER_MODULE = 36_369
 DEFAULT_MAX_TOKEN_PER_LEAF_MODULE = 16_000
+# Default number of modules documented concurrently
+DEFAULT_LLM_CONCURRENCY = 5
 # Legacy constants (for backward compatibility)
 MAX_TOKEN_PER_MODULE = DEFAULT_MAX_TOKEN_PER_MODULE
 MAX_TOKEN_PER_LEAF_MODULE = DEFAULT_MAX_TOKEN_PER_LEAF_MODULE
@@ -75,6 +77,8 @@ class Config:
     agent_instructions: Optional[Dict[str, Any]] = None
     # OpenRouter reasoning
     include_reasoning: bool = False
+    # Maximum number of concurrent module documentation LLM calls
+    llm_concurrency: int = DEFAULT_LLM_CONCURRENCY
 
     @property
     def include_patterns(self) -> Optional[List[str]]:
@@ -179,6 +183,7 @@ class Config:
         max_depth: int = MAX_DEPTH,
         agent_instructions: Optional[Dict[str, Any]] = None,
         include_reasoning: bool = False,
+        llm_concurrency: int = DEFAULT_LLM_CONCURRENCY,
     ) -> "Config":
         """
         Create configuration for CLI context.
@@ -196,6 +201,7 @@ class Config:
             max_token_per_leaf_module: Maximum tokens per leaf module
             max_depth: Maximum depth for hierarchical decomposition
             agent_instructions: Custom agent instructions dict
+            llm_concurrency: Maximum number of modules documented concurrently
 
         Returns:
             Config instance
@@ -221,4 +227,5 @@ class Config:
             max_token_per_leaf_module=max_token_per_leaf_module,
             agent_instructions=agent_instructions,
             include_reasoning=include_reasoning,
+            llm_concurrency=llm_concurrency,
         )
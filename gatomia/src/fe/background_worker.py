@@ -16,6 +16,7 @@ from typing import Dict
 from dataclasses import asdict
 
 from gatomia.src.be.documentation_generator import DocumentationGenerator
+from gatomia.src.be.llm_services import run_and_close_llm_clients
 from gatomia.src.config import Config, MAIN_MODEL
 from .models import JobStatus
 from .cache_manager import CacheManager
@@ -230,7 +231,8 @@ class BackgroundWorker:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
             try:
-                loop.run_until_complete(doc_generator.run())
+                # Stop the pooled LLM clients before their loop goes away
+                loop.run_until_complete(run_and_close_llm_clients(doc_generator.run()))
             finally:
                 loop.close()
 
@@ -1,26 +1,31 @@
+"""
+PYTEST_DONT_REWRITE
+
+Manual verification of module summarization and imports extraction.
+Run directly: python verify_optimizations_manual.py
+"""
+
+import contextlib
 import sys
 import os
-from unittest.mock import MagicMock, patch
+import re
+import types
+from unittest.mock import patch
 from gatomia.src.be.documentation_generator import DocumentationGenerator
 from gatomia.src.be.prompt_template import format_user_prompt
 from gatomia.src.be.dependency_analyzer.models.core import Node
-from gatomia.src.config import Config
-
 
-def verify_summarization():
-    print("Verifying Smart Summarization...")
-    config = MagicMock(spec=Config)
-    config.docs_dir = "/tmp/gatomia_docs"
-    # AgentOrchestrator inside generator might be tricky if it does stuff in init, but we mock it or ignoring
-    # DocumentationGenerator init:
-    # self.agent_orchestrator = AgentOrchestrator(config) -> this might fail if config is mock
-    # So we patch AgentOrchestrator
+# Sections the summary must keep, and sections it must drop
+_SUMMARY_NEEDLES = ("# Module Title", "## Overview", "## Architecture")
+_SUMMARY_FORBIDDEN = ("## Core Components",)
+_SUMMARY_RE = re.compile("|".join(map(re.escape, _SUMMARY_NEEDLES + _SUMMARY_FORBIDDEN)))
 
-    with patch("gatomia.src.be.documentation_generator.AgentOrchestrator") as MockOrchestrator:
-        with patch("gatomia.src.be.documentation_generator.DependencyGraphBuilder"):
-            generator = DocumentationGenerator(config)
+# Text the user prompt must contain
+_IMPORTS_NEEDLES = ("## Imports/Context:", "import os", "class Component1")
+_IMPORTS_RE = re.compile("|".join(map(re.escape, _IMPORTS_NEEDLES)))
 
-            full_markdown = """# Module Title
+# Module doc fed to the summarizer
+_FULL_MARKDOWN = """# Module Title
 
 ## Overview
 This is the overview section.
@@ -31,60 +36,83 @@ Architecture details here.
 ## Core Components
 Should be excluded.
 """
-            summary = generator._extract_module_summary(full_markdown)
 
-            # Debug output
-            # print(f"DEBUG SUMMARY:\n{summary}\n---")
+# Contents of the component's source file, as returned by the patched load_text
+_FAKE_SOURCE = "import os\nfrom typing import List\n\n\nclass Component1:\n    pass"
+
+# The single component of the module whose user prompt is checked
+_NODE1 = Node(
+    id="comp1",
+    name="Component1",
+    file_path="/tmp/file1.py",
+    relative_path="src/file1.py",
+    source_code="class Component1:\n    pass",
+    start_line=10,
+    end_line=12,
+    component_type="class",
+    component_id="comp1",
+)
+_COMPONENTS = {"comp1": _NODE1}
+_MODULE_TREE = {"MyModule": {"components": ["comp1"], "children": {}}}
+
+
+def build_generator() -> DocumentationGenerator:
+    """Create a DocumentationGenerator; the caller patches out its collaborators."""
+    # The summarizer only needs docs_dir; a plain namespace avoids spec'ing a mock on Config
+    config = types.SimpleNamespace(docs_dir="/tmp/gatomia_docs")
+    return DocumentationGenerator(config)
+
+
+def verify_summarization(generator: DocumentationGenerator):
+    print("Verifying Smart Summarization...")
+
+    summary = generator._extract_module_summary(_FULL_MARKDOWN)
+
+    # Debug output
+    # print(f"DEBUG SUMMARY:\n{summary}\n---")
 
-            assert "# Module Title" in summary, "Missing title"
-            assert "## Overview" in summary, "Missing Overview"
-            assert "## Architecture" in summary, "Missing Architecture"
-            assert "## Core Components" not in summary, "Failed to exclude Core Components"
-            print("✅ Summarization Logic OK")
+    # One scan finds every needle present; a leaked section is the likelier regression,
+    # so it is reported first
+    found = set(_SUMMARY_RE.findall(summary))
+    leaked = set(_SUMMARY_FORBIDDEN) & found
+    assert not leaked, f"Failed to exclude: {sorted(leaked)}"
+    missing = set(_SUMMARY_NEEDLES) - found
+    assert not missing, f"Missing: {sorted(missing)}"
+    print("✅ Summarization Logic OK")
 
 
 def verify_imports_extraction():
     print("Verifying Imports Extraction...")
 
-    node1 = Node(
-        id="comp1",
-        name="Component1",
-        file_path="/tmp/file1.py",
-        relative_path="src/file1.py",
-        source_code="class Component1:\n    pass",
-        start_line=10,
-        end_line=12,
-        component_type="class",
-        component_id="comp1",
-    )
-
-    components = {"comp1": node1}
-    module_tree = {"MyModule": {"components": ["comp1"], "children": {}}}
-
     with patch("gatomia.src.utils.file_manager.load_text") as mock_load:
-        mock_load.return_value = (
-            "import os\nfrom typing import List\n\n\nclass Component1:\n    pass"
-        )
+        mock_load.return_value = _FAKE_SOURCE
 
         prompt = format_user_prompt(
             module_name="MyModule",
             core_component_ids=["comp1"],
-            components=components,
-            module_tree=module_tree,
+            components=_COMPONENTS,
+            module_tree=_MODULE_TREE,
         )
 
         # print(f"DEBUG PROMPT:\n{prompt[:500]}...\n---")
 
-        assert "## Imports/Context:" in prompt, "Missing Imports section"
-        assert "import os" in prompt, "Missing specific import"
-        assert "class Component1" in prompt, "Missing component code"
+        missing = set(_IMPORTS_NEEDLES) - set(_IMPORTS_RE.findall(prompt))
+        assert not missing, f"Missing: {sorted(missing)}"
         print("✅ Imports Extraction OK")
 
 
 if __name__ == "__main__":
     try:
-        verify_summarization()
-        verify_imports_extraction()
+        with contextlib.ExitStack() as stack:
+            # DocumentationGenerator's constructor builds these; the checks don't need them
+            stack.enter_context(patch("gatomia.src.be.documentation_generator.AgentOrchestrator"))
+            stack.enter_context(
+                patch("gatomia.src.be.documentation_generator.DependencyGraphBuilder")
+            )
+            generator = build_generator()
+
+            verify_summarization(generator)
+            verify_imports_extraction()
         print("All checks passed successfully.")
     except AssertionError as e:
         print(f"❌ Verification Failed: {e}")